@@ -34,6 +34,12 @@ class PlanCommands:
             self._orchestrator = PlannerOrchestrator(self.project_path, self.model)
         return self._orchestrator
 
+    def close(self) -> None:
+        """Release the orchestrator's open files."""
+        if self._orchestrator is not None:
+            self._orchestrator.close()
+            self._orchestrator = None
+
     def handle_command(self, args: list[str]) -> None:
         """Handle a /plan command.
 
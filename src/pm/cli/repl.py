@@ -224,6 +224,8 @@ class REPL:
     def _cmd_quit(self, args: list[str]) -> None:
         """Exit the REPL."""
         console.print("[dim]Goodbye![/dim]")
+        if self._plan_commands is not None:
+            self._plan_commands.close()
         self.running = False
 
     def _cmd_project(self, args: list[str]) -> None:
@@ -852,6 +854,8 @@ class REPL:
         project_path = self.pm.get_project_path()
 
         if self._plan_commands is None or self._plan_commands.project_path != project_path:
+            if self._plan_commands is not None:
+                self._plan_commands.close()
             model = self._conversation.model_key if self._conversation else "claude"
             self._plan_commands = PlanCommands(project_path, model)
 
@@ -1,5 +1,6 @@
 """Artifact Manager - CRUD operations for features and requirements."""
 
+from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
@@ -49,11 +50,14 @@ class ArtifactManager:
         existing_ids = [f.id for f in self.list_features()]
         feature_id = generate_id("F", existing_ids)
 
+        now = datetime.now()
         feature = Feature(
             id=feature_id,
             title=title,
             description=description,
             priority=priority,
+            created=now,
+            updated=now,
         )
 
         self._save_feature(feature)
@@ -76,8 +80,6 @@ class ArtifactManager:
 
     def update_feature(self, feature: Feature) -> None:
         """Update an existing feature."""
-        from datetime import datetime
-
         feature.updated = datetime.now()
         self._save_feature(feature)
 
@@ -112,6 +114,7 @@ class ArtifactManager:
         existing_ids = [r.id for r in self.list_requirements(is_functional)]
         req_id = generate_id(prefix, existing_ids)
 
+        now = datetime.now()
         requirement = Requirement(
             id=req_id,
             title=title,
@@ -119,6 +122,8 @@ class ArtifactManager:
             feature=feature_id,
             priority=priority,
             is_functional=is_functional,
+            created=now,
+            updated=now,
         )
 
         self._save_requirement(requirement)
@@ -152,8 +157,6 @@ class ArtifactManager:
 
     def update_requirement(self, requirement: Requirement) -> None:
         """Update an existing requirement."""
-        from datetime import datetime
-
         requirement.updated = datetime.now()
         self._save_requirement(requirement)
 
@@ -208,6 +211,7 @@ class ArtifactManager:
         existing_ids = [t.id for t in self.list_tasks()]
         task_id = generate_id("T", existing_ids)
 
+        now = datetime.now()
         task = Task(
             id=task_id,
             title=title,
@@ -216,6 +220,8 @@ class ArtifactManager:
             estimated_complexity=complexity,
             requirement=requirement_id,
             depends_on=depends_on or [],
+            created=now,
+            updated=now,
         )
 
         self._save_task(task)
@@ -240,8 +246,6 @@ class ArtifactManager:
 
     def update_task(self, task: Task) -> None:
         """Update an existing task."""
-        from datetime import datetime
-
         task.updated = datetime.now()
         self._save_task(task)
 
@@ -22,6 +22,7 @@ from pm.core.planner.context import ContextBuilder
 from pm.core.planner.checkpoints import CheckpointManager
 from pm.core.planner.codebase_analyzer import CodebaseAnalyzer
 from pm.core.planner.docs_fetcher import DocsFetcher
+from pm.core.planner.response_cache import PlanCache
 
 __all__ = [
     "PlannerOrchestrator",
@@ -33,4 +34,5 @@ __all__ = [
     "CheckpointManager",
     "CodebaseAnalyzer",
     "DocsFetcher",
+    "PlanCache",
 ]
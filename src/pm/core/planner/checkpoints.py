@@ -1,5 +1,7 @@
 """Checkpoint Manager - Manages planning checkpoints and user approvals."""
 
+import threading
+from concurrent.futures import Executor, Future
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -10,7 +12,13 @@ from pm.models.planner import (
     PlanningPhase,
     PlanningSession,
 )
-from pm.storage.files import read_yaml_file, write_yaml_file, ensure_directory
+from pm.storage.files import (
+    dump_json,
+    read_json_file,
+    read_yaml_file,
+    write_json_file,
+    ensure_directory,
+)
 
 
 class CheckpointManager:
@@ -28,32 +36,71 @@ class CheckpointManager:
         """
         self.project_path = project_path
         self.planning_dir = project_path / "planning"
-        self.session_file = self.planning_dir / "session.yaml"
+        self.session_file = self.planning_dir / "session.json"
+        # Sessions written before the switch to JSON
+        self.legacy_session_file = self.planning_dir / "session.yaml"
         ensure_directory(self.planning_dir)
 
+        # Serializes session writes from background saves
+        self._write_lock = threading.Lock()
+
     def load_session(self) -> Optional[PlanningSession]:
         """Load the current planning session.
 
         Returns:
             The current session, or None if no session exists.
         """
-        if not self.session_file.exists():
+        if self.session_file.exists():
+            data = read_json_file(self.session_file)
+        elif self.legacy_session_file.exists():
+            data = read_yaml_file(self.legacy_session_file)
+        else:
             return None
 
-        data = read_yaml_file(self.session_file)
         if not data:
             return None
 
         return PlanningSession.from_dict(data)
 
-    def save_session(self, session: PlanningSession) -> None:
+    def save_session(self, session: PlanningSession, sync: bool = False) -> None:
         """Save the planning session.
 
         Args:
             session: The session to save.
+            sync: Also fsync the file so the save survives a crash.
+        """
+        self._write_session_data(self._encode_session(session), sync)
+
+    def save_session_async(
+        self,
+        session: PlanningSession,
+        executor: Executor,
+        sync: bool = False,
+    ) -> Future[None]:
+        """Save the planning session on a background thread.
+
+        The session is serialized immediately, so later changes to it are not
+        included; only the file write happens on the executor.
+
+        Args:
+            session: The session to save.
+            executor: Executor to run the write on.
+            sync: Also fsync the file so the save survives a crash.
+
+        Returns:
+            Future that completes when the session has been written.
         """
+        return executor.submit(self._write_session_data, self._encode_session(session), sync)
+
+    def _encode_session(self, session: PlanningSession) -> bytes:
+        """Stamp and serialize the session for writing."""
         session.updated = datetime.now()
-        write_yaml_file(self.session_file, session.to_dict())
+        return dump_json(session.to_dict())
+
+    def _write_session_data(self, data: bytes, sync: bool) -> None:
+        """Replace the session file with serialized session data."""
+        with self._write_lock:
+            write_json_file(self.session_file, data, sync)
 
     def create_checkpoint(
         self,
@@ -61,6 +108,7 @@ class CheckpointManager:
         phase: PlanningPhase,
         description: str,
         artifacts: list[str] | None = None,
+        response_key: str = "",
     ) -> Checkpoint:
         """Create a new checkpoint.
 
@@ -69,12 +117,13 @@ class CheckpointManager:
             phase: The phase this checkpoint is for.
             description: Description of what was accomplished.
             artifacts: List of artifact paths created.
+            response_key: Response cache key of the phase output.
 
         Returns:
             The created checkpoint.
         """
-        checkpoint = session.add_checkpoint(phase, description, artifacts)
-        self.save_session(session)
+        checkpoint = session.add_checkpoint(phase, description, artifacts, response_key)
+        self.save_session(session, sync=True)
         return checkpoint
 
     def approve_checkpoint(
@@ -98,7 +147,7 @@ class CheckpointManager:
                 checkpoint.status = CheckpointStatus.APPROVED
                 checkpoint.approved_at = datetime.now()
                 checkpoint.feedback = feedback
-                self.save_session(session)
+                self.save_session(session, sync=True)
                 return checkpoint
         return None
 
@@ -122,7 +171,7 @@ class CheckpointManager:
             if checkpoint.id == checkpoint_id:
                 checkpoint.status = CheckpointStatus.REJECTED
                 checkpoint.feedback = feedback
-                self.save_session(session)
+                self.save_session(session, sync=True)
                 return checkpoint
         return None
 
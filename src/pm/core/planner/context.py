@@ -13,6 +13,9 @@ from pm.models.planner import (
 )
 from pm.storage.files import read_frontmatter_file, read_yaml_file
 
+# Dependent-group interface block; `methods` is pre-indented, one per line
+_INTERFACE_TEMPLATE = "```typescript\ninterface {name} {{\n{methods}}}\n```"
+
 
 class ContextBuilder:
     """Builds context strings from artifacts for each planning phase.
@@ -52,6 +55,10 @@ class ContextBuilder:
 
         return ""
 
+    def prd_exists(self) -> bool:
+        """Check whether a PRD exists without reading it."""
+        return (self.project_path / "PRD.md").exists() or (self.docs_dir / "PRD.md").exists()
+
     # --- Feature/Requirement Loading ---
 
     def load_features(self) -> list[Feature]:
@@ -292,9 +299,10 @@ class ContextBuilder:
 
             # Other layers (for context)
             sections.append("\n## All Layers\n")
+            markers = {layer_id: ">>> "}
+            append = sections.append
             for layer in layers.layers:
-                marker = ">>> " if layer.id == layer_id else "    "
-                sections.append(f"{marker}{layer.id}: {layer.name} (order: {layer.order})")
+                append(f"{markers.get(layer.id, '    ')}{layer.id}: {layer.name} (order: {layer.order})")
 
             sections.append("")
 
@@ -355,12 +363,10 @@ class ContextBuilder:
                     sections.append(f"### From {dep_group.name}")
                     if dep_group.contracts.interfaces:
                         for interface in dep_group.contracts.interfaces:
-                            sections.append(f"```typescript")
-                            sections.append(f"interface {interface.name} {{")
-                            for method in interface.methods:
-                                sections.append(f"  {method}")
-                            sections.append(f"}}")
-                            sections.append(f"```")
+                            methods = "".join(f"  {method}\n" for method in interface.methods)
+                            sections.append(
+                                _INTERFACE_TEMPLATE.format(name=interface.name, methods=methods)
+                            )
 
             sections.append("")
 
@@ -418,7 +424,7 @@ class ContextBuilder:
         layers = self.load_layers()
 
         return {
-            "prd_exists": bool(self.load_prd()),
+            "prd_exists": self.prd_exists(),
             "feature_count": len(features),
             "requirement_count": len(requirements),
             "tech_stack_defined": tech_stack is not None,
@@ -8,6 +8,22 @@ from urllib.parse import quote
 
 from pm.storage.files import ensure_directory
 
+# Common section headings, matched against the full heading text
+_SECTION_HEADINGS = {
+    "installation": re.compile(r"Install(?:ation)?|Getting\s+Started", re.IGNORECASE),
+    "quick_start": re.compile(r"Quick\s+Start|Quickstart", re.IGNORECASE),
+    "usage": re.compile(r"Usage|Basic\s+Usage", re.IGNORECASE),
+    "api": re.compile(r"API|API\s+Reference", re.IGNORECASE),
+    "configuration": re.compile(r"Config(?:uration)?|Options", re.IGNORECASE),
+    "examples": re.compile(r"Examples?", re.IGNORECASE),
+}
+
+# Level-one or level-two markdown heading; deeper headings stay in the section body
+_HEADING_RE = re.compile(r"#{1,2} (.*)")
+
+# Lines that open or close a fenced code block, whose "#" lines are comments, not headings
+_FENCE_MARKERS = ("```", "~~~")
+
 
 class DocsFetcher:
     """Fetches and caches technology documentation for planning phases.
@@ -38,18 +54,7 @@ class DocsFetcher:
         Returns:
             Package info dict, or None if not found.
         """
-        import urllib.request
-        import urllib.error
-
-        # Handle scoped packages (@org/pkg -> %40org%2Fpkg)
-        encoded_name = quote(package_name, safe="")
-        url = f"https://registry.npmjs.org/{encoded_name}"
-
-        try:
-            with urllib.request.urlopen(url, timeout=10) as response:
-                return json.loads(response.read().decode("utf-8"))
-        except (urllib.error.URLError, urllib.error.HTTPError, json.JSONDecodeError):
-            return None
+        return self._fetch_json(self._registry_url(package_name, "npm"))[0]
 
     def fetch_pypi_package_info(self, package_name: str) -> Optional[dict]:
         """Fetch package info from PyPI.
@@ -60,16 +65,55 @@ class DocsFetcher:
         Returns:
             Package info dict, or None if not found.
         """
+        return self._fetch_json(self._registry_url(package_name, "pypi"))[0]
+
+    def _registry_url(self, package_name: str, registry: str) -> str:
+        """Get the package info URL for a registry."""
+        if registry == "npm":
+            # Handle scoped packages (@org/pkg -> %40org%2Fpkg)
+            return f"https://registry.npmjs.org/{quote(package_name, safe='')}"
+        return f"https://pypi.org/pypi/{package_name}/json"
+
+    def _fetch_json(
+        self,
+        url: str,
+        validators: Optional[dict] = None,
+    ) -> tuple[Optional[dict], dict, bool]:
+        """Fetch JSON from a registry, revalidating with cached HTTP validators.
+
+        Args:
+            url: URL to fetch.
+            validators: Cached "etag"/"last_modified" values for a conditional GET.
+
+        Returns:
+            Tuple of (package info, validators, not modified). Package info is None
+            when the fetch failed or the server answered 304 Not Modified.
+        """
         import urllib.request
         import urllib.error
 
-        url = f"https://pypi.org/pypi/{package_name}/json"
+        headers = {}
+        if validators:
+            if validators.get("etag"):
+                headers["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                headers["If-Modified-Since"] = validators["last_modified"]
 
+        request = urllib.request.Request(url, headers=headers)
         try:
-            with urllib.request.urlopen(url, timeout=10) as response:
-                return json.loads(response.read().decode("utf-8"))
-        except (urllib.error.URLError, urllib.error.HTTPError, json.JSONDecodeError):
-            return None
+            with urllib.request.urlopen(request, timeout=10) as response:
+                package_info = json.loads(response.read().decode("utf-8"))
+                new_validators = {
+                    "etag": response.headers.get("ETag", ""),
+                    "last_modified": response.headers.get("Last-Modified", ""),
+                }
+                return package_info, new_validators, False
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                return None, validators or {}, True
+            return None, {}, False
+        except (urllib.error.URLError, json.JSONDecodeError):
+            return None, {}, False
 
     def extract_npm_readme(self, package_info: dict) -> str:
         """Extract README content from npm package info.
@@ -142,6 +186,10 @@ class DocsFetcher:
     def _extract_key_sections(self, content: str) -> dict[str, str]:
         """Extract key sections from markdown documentation.
 
+        Splits the document on ``#`` and ``##`` headings in one pass, skipping
+        lines inside code fences; the prose before the first heading, or under
+        a leading title heading, doubles as the description.
+
         Args:
             content: Raw markdown content.
 
@@ -150,36 +198,50 @@ class DocsFetcher:
         """
         sections = {}
 
-        # Extract first paragraph as description
-        first_para_match = re.search(r"^(?:#[^\n]*\n+)?([^\n#]+(?:\n[^\n#]+)*)", content)
-        if first_para_match:
-            sections["description"] = first_para_match.group(1).strip()[:1000]
-
-        # Common section patterns
-        section_patterns = {
-            "installation": r"##?\s*(?:Install(?:ation)?|Getting\s+Started)\s*\n(.*?)(?=\n##|\Z)",
-            "quick_start": r"##?\s*(?:Quick\s+Start|Quickstart)\s*\n(.*?)(?=\n##|\Z)",
-            "usage": r"##?\s*(?:Usage|Basic\s+Usage)\s*\n(.*?)(?=\n##|\Z)",
-            "api": r"##?\s*(?:API|API\s+Reference)\s*\n(.*?)(?=\n##|\Z)",
-            "configuration": r"##?\s*(?:Config(?:uration)?|Options)\s*\n(.*?)(?=\n##|\Z)",
-            "examples": r"##?\s*(?:Examples?)\s*\n(.*?)(?=\n##|\Z)",
-        }
-
-        for section_name, pattern in section_patterns.items():
-            match = re.search(pattern, content, re.IGNORECASE | re.DOTALL)
-            if match:
-                section_content = match.group(1).strip()
-                # Limit each section
-                sections[section_name] = section_content[:2000]
+        chunks: list[tuple[str, list[str]]] = [("", [])]
+        in_fence = False
+        for line in content.splitlines():
+            if line.startswith(_FENCE_MARKERS):
+                in_fence = not in_fence
+            elif not in_fence:
+                heading = _HEADING_RE.match(line)
+                if heading:
+                    chunks.append((heading.group(1).strip(), []))
+                    continue
+            chunks[-1][1].append(line)
+
+        # Extract first paragraph (after an optional title line) as description
+        prose = chunks[0][1]
+        if not prose and len(chunks) > 1:
+            # Document opens with a title heading
+            prose = chunks[1][1]
+        if prose and prose[0].startswith("#"):
+            prose = prose[1:]
+        description = "\n".join(prose).strip().split("\n\n", 1)[0]
+        if description:
+            sections["description"] = description[:1000]
+
+        for heading, body in chunks[1:]:
+            for section_name, heading_re in _SECTION_HEADINGS.items():
+                if section_name not in sections and heading_re.fullmatch(heading):
+                    # Limit each section
+                    sections[section_name] = "\n".join(body).strip()[:2000]
+                    break
 
         return sections
 
-    def fetch_and_cache(self, package_name: str, registry: str = "npm") -> Optional[Path]:
+    def fetch_and_cache(
+        self,
+        package_name: str,
+        registry: str = "npm",
+        refresh: bool = False,
+    ) -> Optional[Path]:
         """Fetch documentation and cache it locally.
 
         Args:
             package_name: Name of the package.
             registry: Registry to fetch from ("npm" or "pypi").
+            refresh: Revalidate an existing cache entry with a conditional GET.
 
         Returns:
             Path to the cached summary, or None if fetch failed.
@@ -187,25 +249,37 @@ class DocsFetcher:
         # Check cache first
         cache_dir = self.docs_dir / package_name.lower().replace("/", "-").replace("@", "")
         summary_path = cache_dir / "summary.md"
+        meta_path = cache_dir / "meta.json"
 
-        if summary_path.exists():
+        cached = summary_path.exists()
+        if cached and not refresh:
             return summary_path
 
-        # Fetch from registry
-        if registry == "npm":
-            package_info = self.fetch_npm_package_info(package_name)
-            if package_info:
+        if registry not in ("npm", "pypi"):
+            return None
+
+        # Fetch from registry, sending cached validators when revalidating
+        validators = self._load_validators(meta_path) if cached else None
+        package_info, validators, not_modified = self._fetch_json(
+            self._registry_url(package_name, registry),
+            validators,
+        )
+
+        if cached and not_modified:
+            summary_path.touch()
+            return summary_path
+
+        if cached and not package_info:
+            # Keep the existing summary when revalidation fails
+            return summary_path
+
+        if package_info:
+            if registry == "npm":
                 content = self.extract_npm_readme(package_info)
             else:
-                content = ""
-        elif registry == "pypi":
-            package_info = self.fetch_pypi_package_info(package_name)
-            if package_info:
                 content = self.extract_pypi_description(package_info)
-            else:
-                content = ""
         else:
-            return None
+            content = ""
 
         # Summarize and cache
         summary = self.summarize_documentation(content, package_name)
@@ -213,15 +287,31 @@ class DocsFetcher:
         ensure_directory(cache_dir)
         summary_path.write_text(summary)
 
-        # Also save metadata
+        # Also save metadata, including validators for later revalidation
         if package_info:
-            meta_path = cache_dir / "meta.json"
             meta = self._extract_metadata(package_info, registry)
+            meta.update(validators)
             with open(meta_path, "w") as f:
                 json.dump(meta, f, indent=2)
 
         return summary_path
 
+    def _load_validators(self, meta_path: Path) -> dict:
+        """Load cached HTTP validators from a metadata file."""
+        if not meta_path.exists():
+            return {}
+
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+        return {
+            "etag": meta.get("etag", ""),
+            "last_modified": meta.get("last_modified", ""),
+        }
+
     def _extract_metadata(self, package_info: dict, registry: str) -> dict:
         """Extract package metadata.
 
@@ -260,12 +350,14 @@ class DocsFetcher:
         self,
         tech_names: list[str],
         registry: str = "npm",
+        refresh: bool = False,
     ) -> dict[str, str]:
         """Fetch documentation for a list of technologies.
 
         Args:
             tech_names: List of package/technology names.
             registry: Default registry to use.
+            refresh: Revalidate already cached docs with conditional GETs.
 
         Returns:
             Dict mapping tech name to summary content.
@@ -283,7 +375,7 @@ class DocsFetcher:
             else:
                 actual_registry = registry
 
-            summary_path = self.fetch_and_cache(tech_name, actual_registry)
+            summary_path = self.fetch_and_cache(tech_name, actual_registry, refresh=refresh)
             if summary_path and summary_path.exists():
                 docs[tech_name] = summary_path.read_text()
 
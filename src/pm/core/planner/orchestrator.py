@@ -1,13 +1,16 @@
 """Planner Orchestrator - Coordinates multi-phase planning process."""
 
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Generator, Optional
+from typing import Callable, Generator, Iterator, Optional, TypeVar
 from uuid import uuid4
 
 from pm.core.planner.checkpoints import CheckpointManager
 from pm.core.planner.context import ContextBuilder
 from pm.core.planner.docs_fetcher import DocsFetcher
+from pm.core.planner.response_cache import PlanCache
 from pm.core.planner.phases import (
     ArchitectOutput,
     GroupOutput,
@@ -15,17 +18,46 @@ from pm.core.planner.phases import (
     LayerOutput,
     LayerPlannerPhase,
     PhaseOutput,
+    PhaseRunner,
     TechnicalArchitectPhase,
 )
 from pm.models.planner import (
     CheckpointStatus,
     CodebaseAnalysis,
+    GroupDefinition,
+    LayerDefinition,
     PlanningPhase,
     PlanningSession,
     ProjectType,
 )
 from pm.storage.files import ensure_directory
 
+PhaseT = TypeVar("PhaseT", bound=PhaseRunner)
+DefinitionT = TypeVar("DefinitionT", LayerDefinition, GroupDefinition)
+
+# Enum values for status dicts, resolved once instead of per call
+_PHASE_VALUES = {phase: phase.value for phase in PlanningPhase}
+_PROJECT_TYPE_VALUES = {project_type: project_type.value for project_type in ProjectType}
+_CHECKPOINT_STATUS_VALUES = {status: status.value for status in CheckpointStatus}
+
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    """Get a file's modification time in nanoseconds, or None if it does not exist."""
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def _copy_status(status: dict) -> dict:
+    """Copy a cached status dict, including its nested lists and checkpoint summary."""
+    return {
+        **status,
+        "completed_layers": list(status["completed_layers"]),
+        "completed_groups": list(status["completed_groups"]),
+        "checkpoints": dict(status["checkpoints"]),
+    }
+
 
 class PlannerOrchestrator:
     """Orchestrates the multi-phase planning process.
@@ -34,6 +66,30 @@ class PlannerOrchestrator:
     phases, managing checkpoints and session state between iterations.
     """
 
+    __slots__ = (
+        "project_path",
+        "model",
+        "planning_dir",
+        "checkpoint_manager",
+        "context_builder",
+        "docs_fetcher",
+        "response_cache",
+        "_session",
+        "_phases",
+        "_io_pool",
+        "_pending_docs_future",
+        "_pending_writes",
+        "_dirty",
+        "_batch_depth",
+        "_layers_cache",
+        "_groups_cache",
+        "_listing_cache",
+        "_next_layer_idx",
+        "_last_step",
+        "_status_cache",
+        "_status_etag",
+    )
+
     # Default model for planning
     DEFAULT_MODEL = "claude"
 
@@ -56,9 +112,40 @@ class PlannerOrchestrator:
         self.checkpoint_manager = CheckpointManager(project_path)
         self.context_builder = ContextBuilder(project_path)
         self.docs_fetcher = DocsFetcher(project_path)
+        self.response_cache = PlanCache(project_path)
 
         self._session: Optional[PlanningSession] = None
 
+        # Phase runners, reused across runs and keyed by (phase class, model)
+        self._phases: dict[tuple[type[PhaseRunner], str], PhaseRunner] = {}
+
+        # Background I/O (docs fetching, checkpoint writes) that must not block phases
+        self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="pm-planner-io")
+        self._pending_docs_future: Optional[Future[dict[str, str]]] = None
+        self._pending_writes: list[Future[None]] = []
+
+        # Session saves deferred by _session_batch()
+        self._dirty = False
+        self._batch_depth = 0
+
+        # Planning artifacts loaded from disk with the file mtime they were read at,
+        # reloaded when the file changes and dropped when a phase rewrites them
+        self._layers_cache: Optional[tuple[int, LayerDefinition]] = None
+        self._groups_cache: dict[str, tuple[int, GroupDefinition]] = {}
+
+        # Static listing rows per definition file, with the loaded definition they came from
+        self._listing_cache: dict[Path, tuple[object, tuple[dict, ...]]] = {}
+
+        # Index of the first layer that may still need planning; earlier ones are complete
+        self._next_layer_idx = 0
+
+        # Last step started by continue_planning(), as (action, layer_id, group_id)
+        self._last_step: Optional[tuple[str, Optional[str], Optional[str]]] = None
+
+        # Last get_status() result and the session state it was built from
+        self._status_cache: Optional[dict] = None
+        self._status_etag: Optional[tuple] = None
+
     @property
     def session(self) -> Optional[PlanningSession]:
         """Get the current planning session."""
@@ -66,6 +153,62 @@ class PlannerOrchestrator:
             self._session = self.checkpoint_manager.load_session()
         return self._session
 
+    def close(self) -> None:
+        """Flush pending session changes and release background threads."""
+        self._flush_session()
+        self._wait_for_writes()
+        self._io_pool.shutdown(wait=True, cancel_futures=True)
+
+    @contextmanager
+    def _session_batch(self) -> Iterator[None]:
+        """Defer session saves inside the block and save once on exit."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._flush_session()
+
+    def _mark_dirty(self) -> None:
+        """Record an unsaved session change, saving immediately outside a batch."""
+        self._dirty = True
+        self._status_cache = None
+        if self._batch_depth == 0:
+            self._flush_session()
+
+    def _flush_session(self) -> None:
+        """Save the session if it has unsaved changes."""
+        if self._dirty and self._session is not None:
+            self._wait_for_writes()
+            self.checkpoint_manager.save_session(self._session)
+        self._dirty = False
+
+    def _wait_for_writes(self) -> None:
+        """Wait for background session writes, keeping saves in order."""
+        if self._pending_writes:
+            pending, self._pending_writes = self._pending_writes, []
+            wait(pending)
+            for future in pending:
+                future.result()
+
+    def _create_checkpoint(
+        self,
+        session: PlanningSession,
+        phase: PlanningPhase,
+        description: str,
+        artifacts: list[str],
+        response_key: str,
+    ) -> None:
+        """Create a checkpoint, saving the whole session on the I/O pool."""
+        session.add_checkpoint(phase, description, artifacts, response_key)
+        self._status_cache = None
+        self._wait_for_writes()
+        self._pending_writes.append(
+            self.checkpoint_manager.save_session_async(session, self._io_pool, sync=True)
+        )
+        self._dirty = False
+
     def start_planning(
         self,
         greenfield: bool = True,
@@ -88,7 +231,10 @@ class PlannerOrchestrator:
             current_phase=PlanningPhase.NOT_STARTED,
             target_repo=target_repo,
         )
+        self._next_layer_idx = 0
+        self._status_cache = None
 
+        self._wait_for_writes()
         self.checkpoint_manager.save_session(self._session)
         return self._session
 
@@ -98,35 +244,53 @@ class PlannerOrchestrator:
         Returns:
             Status dict with session info and checkpoint summary.
         """
-        if not self.session:
+        session = self.session
+        if not session:
             return {
                 "has_session": False,
                 "message": "No planning session. Use /plan start to begin.",
             }
 
-        checkpoint_summary = self.checkpoint_manager.get_checkpoint_summary(self.session)
+        # Repeat polls of an unchanged session get a copy of the previous dict
+        etag = (
+            id(session),
+            session.current_phase,
+            session.current_layer_id,
+            session.current_group_id,
+            len(session.completed_layers),
+            len(session.completed_groups),
+            len(session.checkpoints),
+        )
+        if self._status_cache is not None and self._status_etag == etag:
+            return _copy_status(self._status_cache)
 
-        return {
+        checkpoint_summary = self.checkpoint_manager.get_checkpoint_summary(session)
+
+        self._status_etag = etag
+        self._status_cache = {
             "has_session": True,
-            "session_id": self.session.id,
-            "project_type": self.session.project_type.value,
-            "current_phase": self.session.current_phase.value,
-            "current_layer": self.session.current_layer_id,
-            "current_group": self.session.current_group_id,
-            "completed_layers": self.session.completed_layers,
-            "completed_groups": self.session.completed_groups,
+            "session_id": session.id,
+            "project_type": _PROJECT_TYPE_VALUES[session.project_type],
+            "current_phase": _PHASE_VALUES[session.current_phase],
+            "current_layer": session.current_layer_id,
+            "current_group": session.current_group_id,
+            "completed_layers": sorted(session.completed_layers),
+            "completed_groups": sorted(session.completed_groups),
             "checkpoints": checkpoint_summary,
             "can_continue": checkpoint_summary["can_proceed"],
         }
+        return _copy_status(self._status_cache)
 
     def run_architect_phase(
         self,
         codebase_analysis: Optional[CodebaseAnalysis] = None,
+        fresh: bool = False,
     ) -> Generator[str, None, ArchitectOutput]:
         """Run the Technical Architect phase.
 
         Args:
             codebase_analysis: Optional analysis for brownfield projects.
+            fresh: Ask the LLM even if a response to this prompt is cached.
 
         Yields:
             Response chunks as they arrive.
@@ -134,48 +298,72 @@ class PlannerOrchestrator:
         Returns:
             Architect phase output.
         """
-        if not self.session:
+        session = self.session
+        if not session:
             raise ValueError("No planning session. Call start_planning() first.")
 
         # Check if we can proceed
-        if not self.checkpoint_manager.can_proceed(self.session):
+        if not self.checkpoint_manager.can_proceed(session):
             raise ValueError("Pending checkpoint. Approve or reject before continuing.")
 
-        # Update session state
-        self.session.current_phase = PlanningPhase.ARCHITECT
-        self.checkpoint_manager.save_session(self.session)
-
-        # Create and run phase
-        phase = TechnicalArchitectPhase(self.project_path, self.model)
-        inputs = {"codebase_analysis": codebase_analysis}
+        return (yield from self._run_architect_phase(session, codebase_analysis, fresh))
 
-        # Run phase with streaming
-        output = yield from phase.run(inputs)
-
-        # Create checkpoint
-        if output.success:
-            self.checkpoint_manager.create_checkpoint(
-                self.session,
-                PlanningPhase.ARCHITECT,
-                f"Architecture defined: {len(output.layers.layers) if output.layers else 0} layers",
-                output.artifacts,
-            )
-
-            # Fetch documentation for selected technologies
-            if output.tech_stack:
-                tech_names = self._get_tech_names(output)
-                self.docs_fetcher.fetch_tech_stack_docs(tech_names)
+    def _run_architect_phase(
+        self,
+        session: PlanningSession,
+        codebase_analysis: Optional[CodebaseAnalysis],
+        fresh: bool = False,
+    ) -> Generator[str, None, ArchitectOutput]:
+        """Run the Technical Architect phase on an already validated session."""
+        with self._session_batch():
+            # Update session state
+            session.current_phase = PlanningPhase.ARCHITECT
+            self._mark_dirty()
+
+            # Create and run phase
+            phase = self._get_phase(TechnicalArchitectPhase)
+            inputs = {"codebase_analysis": codebase_analysis}
+
+            # Run phase with streaming
+            output = yield from phase.run(inputs, fresh=fresh)
+
+            # Create checkpoint
+            if output.success:
+                self._create_checkpoint(
+                    session,
+                    PlanningPhase.ARCHITECT,
+                    f"Architecture defined: {len(output.layers.layers) if output.layers else 0} layers",
+                    output.artifacts,
+                    output.cache_key,
+                )
+
+                # New layers invalidate everything derived from the old ones
+                self._layers_cache = None
+                self._groups_cache.clear()
+                self._next_layer_idx = 0
+
+                # Fetch documentation for selected technologies in the background;
+                # later phases wait for it before building their context. Docs
+                # cached by an earlier run are revalidated, which costs a 304
+                # when the registry entry is unchanged.
+                if output.tech_stack:
+                    tech_names = self._get_tech_names(output)
+                    self._pending_docs_future = self._io_pool.submit(
+                        self.docs_fetcher.fetch_tech_stack_docs, tech_names, refresh=True
+                    )
 
         return output
 
     def run_layer_planning(
         self,
         layer_id: str,
+        fresh: bool = False,
     ) -> Generator[str, None, LayerOutput]:
         """Run the Layer Planner phase for a specific layer.
 
         Args:
             layer_id: ID of the layer to plan.
+            fresh: Ask the LLM even if a response to this prompt is cached.
 
         Yields:
             Response chunks as they arrive.
@@ -183,31 +371,49 @@ class PlannerOrchestrator:
         Returns:
             Layer planner output.
         """
-        if not self.session:
+        session = self.session
+        if not session:
             raise ValueError("No planning session.")
 
-        if not self.checkpoint_manager.can_proceed(self.session):
+        if not self.checkpoint_manager.can_proceed(session):
             raise ValueError("Pending checkpoint. Approve or reject before continuing.")
 
-        # Update session state
-        self.session.current_phase = PlanningPhase.LAYER_PLANNING
-        self.session.current_layer_id = layer_id
-        self.checkpoint_manager.save_session(self.session)
-
-        # Create and run phase
-        phase = LayerPlannerPhase(self.project_path, self.model)
-        inputs = {"layer_id": layer_id}
-
-        output = yield from phase.run(inputs)
+        return (yield from self._run_layer_planning(session, layer_id, fresh))
 
-        # Create checkpoint
-        if output.success:
-            self.checkpoint_manager.create_checkpoint(
-                self.session,
-                PlanningPhase.LAYER_PLANNING,
-                f"Layer {layer_id} breakdown: {len(output.groups.groups) if output.groups else 0} groups",
-                output.artifacts,
-            )
+    def _run_layer_planning(
+        self,
+        session: PlanningSession,
+        layer_id: str,
+        fresh: bool = False,
+    ) -> Generator[str, None, LayerOutput]:
+        """Run the Layer Planner phase on an already validated session."""
+        with self._session_batch():
+            # Update session state
+            session.current_phase = PlanningPhase.LAYER_PLANNING
+            session.current_layer_id = layer_id
+            self._mark_dirty()
+
+            # Create and run phase
+            self._wait_for_docs()
+            phase = self._get_phase(LayerPlannerPhase)
+            inputs = {"layer_id": layer_id}
+
+            output = yield from phase.run(inputs, fresh=fresh)
+
+            # Create checkpoint
+            if output.success:
+                # Record the layer's groups; completion checks refresh them from groups.yaml
+                if output.groups:
+                    session.layer_groups[layer_id] = [group.id for group in output.groups.groups]
+
+                self._create_checkpoint(
+                    session,
+                    PlanningPhase.LAYER_PLANNING,
+                    f"Layer {layer_id} breakdown: {len(output.groups.groups) if output.groups else 0} groups",
+                    output.artifacts,
+                    output.cache_key,
+                )
+                self._groups_cache.pop(layer_id, None)
 
         return output
 
@@ -215,12 +421,14 @@ class PlannerOrchestrator:
         self,
         layer_id: str,
         group_id: str,
+        fresh: bool = False,
     ) -> Generator[str, None, GroupOutput]:
         """Run the Group Planner phase for a specific group.
 
         Args:
             layer_id: ID of the layer containing the group.
             group_id: ID of the group to plan.
+            fresh: Ask the LLM even if a response to this prompt is cached.
 
         Yields:
             Response chunks as they arrive.
@@ -228,36 +436,51 @@ class PlannerOrchestrator:
         Returns:
             Group planner output.
         """
-        if not self.session:
+        session = self.session
+        if not session:
             raise ValueError("No planning session.")
 
-        if not self.checkpoint_manager.can_proceed(self.session):
+        if not self.checkpoint_manager.can_proceed(session):
             raise ValueError("Pending checkpoint. Approve or reject before continuing.")
 
-        # Update session state
-        self.session.current_phase = PlanningPhase.GROUP_PLANNING
-        self.session.current_group_id = group_id
-        self.checkpoint_manager.save_session(self.session)
-
-        # Create and run phase
-        phase = GroupPlannerPhase(self.project_path, self.model)
-        inputs = {"layer_id": layer_id, "group_id": group_id}
-
-        output = yield from phase.run(inputs)
+        return (yield from self._run_group_planning(session, layer_id, group_id, fresh))
 
-        # Create checkpoint
-        if output.success:
-            self.checkpoint_manager.create_checkpoint(
-                self.session,
-                PlanningPhase.GROUP_PLANNING,
-                f"Group {group_id} tasks: {len(output.task_ids)} tasks created",
-                output.artifacts,
-            )
-
-            # Mark group as completed
-            if group_id not in self.session.completed_groups:
-                self.session.completed_groups.append(group_id)
-                self.checkpoint_manager.save_session(self.session)
+    def _run_group_planning(
+        self,
+        session: PlanningSession,
+        layer_id: str,
+        group_id: str,
+        fresh: bool = False,
+    ) -> Generator[str, None, GroupOutput]:
+        """Run the Group Planner phase on an already validated session."""
+        with self._session_batch():
+            # Update session state
+            session.current_phase = PlanningPhase.GROUP_PLANNING
+            session.current_group_id = group_id
+            self._mark_dirty()
+
+            # Create and run phase
+            self._wait_for_docs()
+            phase = self._get_phase(GroupPlannerPhase)
+            inputs = {"layer_id": layer_id, "group_id": group_id}
+
+            output = yield from phase.run(inputs, fresh=fresh)
+
+            # Create checkpoint
+            if output.success:
+                self._create_checkpoint(
+                    session,
+                    PlanningPhase.GROUP_PLANNING,
+                    f"Group {group_id} tasks: {len(output.task_ids)} tasks created",
+                    output.artifacts,
+                    output.cache_key,
+                )
+
+                # Mark group as completed, and its layer if this was the last group
+                if group_id not in session.completed_groups:
+                    session.completed_groups.add(group_id)
+                    self._mark_dirty()
+                    self._check_layer_completion(layer_id)
 
         return output
 
@@ -270,27 +493,27 @@ class PlannerOrchestrator:
         Returns:
             Checkpoint info dict, or None if no pending checkpoint.
         """
-        if not self.session:
+        session = self.session
+        if not session:
             return None
 
-        pending = self.checkpoint_manager.get_pending_checkpoint(self.session)
+        pending = self.checkpoint_manager.get_pending_checkpoint(session)
         if not pending:
             return None
 
+        self._wait_for_writes()
+        self._status_cache = None
         checkpoint = self.checkpoint_manager.approve_checkpoint(
-            self.session,
+            session,
             pending.id,
             feedback,
         )
 
         if checkpoint:
-            # Check if layer is complete
-            self._check_layer_completion()
-
             return {
                 "id": checkpoint.id,
-                "status": checkpoint.status.value,
-                "phase": checkpoint.phase.value,
+                "status": _CHECKPOINT_STATUS_VALUES[checkpoint.status],
+                "phase": _PHASE_VALUES[checkpoint.phase],
             }
         return None
 
@@ -303,24 +526,31 @@ class PlannerOrchestrator:
         Returns:
             Checkpoint info dict, or None if no pending checkpoint.
         """
-        if not self.session:
+        session = self.session
+        if not session:
             return None
 
-        pending = self.checkpoint_manager.get_pending_checkpoint(self.session)
+        pending = self.checkpoint_manager.get_pending_checkpoint(session)
         if not pending:
             return None
 
+        self._wait_for_writes()
+        self._status_cache = None
         checkpoint = self.checkpoint_manager.reject_checkpoint(
-            self.session,
+            session,
             pending.id,
             feedback,
         )
 
         if checkpoint:
+            # Re-running the phase must not replay the rejected response
+            if checkpoint.response_key:
+                self.response_cache.discard(checkpoint.response_key)
+
             return {
                 "id": checkpoint.id,
-                "status": checkpoint.status.value,
-                "phase": checkpoint.phase.value,
+                "status": _CHECKPOINT_STATUS_VALUES[checkpoint.status],
+                "phase": _PHASE_VALUES[checkpoint.phase],
                 "feedback": feedback,
             }
         return None
@@ -331,70 +561,98 @@ class PlannerOrchestrator:
         Returns:
             Dict with action type and parameters.
         """
-        if not self.session:
+        session = self.session
+        if not session:
             return {"action": "start", "message": "Start a planning session with /plan start"}
 
         # Check for pending checkpoint
-        pending = self.checkpoint_manager.get_pending_checkpoint(self.session)
+        pending = self.checkpoint_manager.get_pending_checkpoint(session)
         if pending:
+            phase_value = _PHASE_VALUES[pending.phase]
             return {
                 "action": "checkpoint",
                 "checkpoint_id": pending.id,
-                "phase": pending.phase.value,
-                "message": f"Pending checkpoint for {pending.phase.value}. Use /plan approve or /plan reject",
-            }
-
-        # Determine next phase based on current state
-        layers = self.context_builder.load_layers()
-        if not layers:
-            return {
-                "action": "architect",
-                "message": "Run architect phase with /plan continue",
+                "phase": phase_value,
+                "message": f"Pending checkpoint for {phase_value}. Use /plan approve or /plan reject",
             }
 
-        # Check for layers needing group planning
-        for layer in layers.layers:
-            if layer.id not in self.session.completed_layers:
-                groups = self.context_builder.load_groups(layer.id)
+        with self._session_batch():
+            # Determine next phase based on current state
+            layers = self._load_layers()
+            if not layers:
+                return {
+                    "action": "architect",
+                    "message": "Run architect phase with /plan continue",
+                }
+
+            completed_layers = session.completed_layers
+            completed_groups = session.completed_groups
+
+            # Layers found complete during this scan, recorded with a single save
+            newly_completed: list[str] = []
+            next_action: Optional[dict] = None
+
+            # Check for layers needing group planning, resuming after completed ones
+            all_layers = layers.layers
+            for idx in range(self._next_layer_idx, len(all_layers)):
+                layer = all_layers[idx]
+                if layer.id in completed_layers:
+                    continue
+
+                self._next_layer_idx = idx
+                groups = self._load_groups(layer.id)
                 if not groups:
-                    return {
+                    next_action = {
                         "action": "layer_planning",
                         "layer_id": layer.id,
                         "message": f"Plan groups for layer {layer.id} with /plan continue",
                     }
+                    break
 
                 # Check for groups needing task planning
-                for group in groups.groups:
-                    if group.id not in self.session.completed_groups:
-                        return {
-                            "action": "group_planning",
-                            "layer_id": layer.id,
-                            "group_id": group.id,
-                            "message": f"Plan tasks for group {group.id} with /plan continue",
-                        }
+                group = next((g for g in groups.groups if g.id not in completed_groups), None)
+                if group:
+                    next_action = {
+                        "action": "group_planning",
+                        "layer_id": layer.id,
+                        "group_id": group.id,
+                        "message": f"Plan tasks for group {group.id} with /plan continue",
+                    }
+                    break
 
                 # All groups in layer complete
-                if layer.id not in self.session.completed_layers:
-                    self.session.completed_layers.append(layer.id)
-                    self.checkpoint_manager.save_session(self.session)
+                newly_completed.append(layer.id)
+            else:
+                self._next_layer_idx = len(all_layers)
 
-        # All done
-        self.session.current_phase = PlanningPhase.COMPLETED
-        self.checkpoint_manager.save_session(self.session)
+            if newly_completed:
+                completed_layers.update(newly_completed)
+                self._mark_dirty()
 
-        return {
-            "action": "completed",
-            "message": "Planning complete. All tasks have been created.",
-        }
+            if next_action:
+                return next_action
+
+            # All done
+            session.current_phase = PlanningPhase.COMPLETED
+            self._mark_dirty()
+
+            return {
+                "action": "completed",
+                "message": "Planning complete. All tasks have been created.",
+            }
 
     def continue_planning(self) -> Generator[str, None, PhaseOutput]:
         """Continue to the next phase of planning.
 
-        Yields:
-            Response chunks as they arrive.
+        Dispatches eagerly and hands back the phase generator itself, so
+        streamed chunks pass through a single generator frame.
 
         Returns:
-            Phase output.
+            Generator yielding response chunks and returning the phase output.
+
+        Raises:
+            ValueError: If there is no session, a checkpoint is pending, or
+                planning is already complete.
         """
         next_action = self.get_next_action()
         action = next_action.get("action")
@@ -408,20 +666,32 @@ class PlannerOrchestrator:
         if action == "completed":
             raise ValueError("Planning is complete.")
 
+        # get_next_action() already ruled out a missing session and a pending
+        # checkpoint, so run the phases without repeating those checks
+        session = self.session
+        assert session is not None
+
+        # The same step coming up again means the last run did not advance the
+        # plan (e.g. the output named another layer), so replaying its cached
+        # response would repeat it forever; ask the LLM again instead
+        step = (action, next_action.get("layer_id"), next_action.get("group_id"))
+        fresh = step == self._last_step
+        self._last_step = step
+
         if action == "architect":
             codebase_analysis = None
-            if self.session and self.session.project_type == ProjectType.BROWNFIELD:
+            if session.project_type == ProjectType.BROWNFIELD:
                 codebase_analysis = self.context_builder.load_codebase_analysis()
-            return (yield from self.run_architect_phase(codebase_analysis))
+            return self._run_architect_phase(session, codebase_analysis, fresh)
 
         if action == "layer_planning":
-            layer_id = next_action.get("layer_id")
-            return (yield from self.run_layer_planning(layer_id))
+            layer_id = next_action["layer_id"]
+            return self._run_layer_planning(session, layer_id, fresh)
 
         if action == "group_planning":
-            layer_id = next_action.get("layer_id")
-            group_id = next_action.get("group_id")
-            return (yield from self.run_group_planning(layer_id, group_id))
+            layer_id = next_action["layer_id"]
+            group_id = next_action["group_id"]
+            return self._run_group_planning(session, layer_id, group_id, fresh)
 
         raise ValueError(f"Unknown action: {action}")
 
@@ -431,19 +701,15 @@ class PlannerOrchestrator:
         Returns:
             List of layer dicts.
         """
-        layers = self.context_builder.load_layers()
-        if not layers:
-            return []
+        rows = self._get_listing_rows(
+            self.planning_dir / "layers.yaml",
+            self._load_layers(),
+            self._build_layer_rows,
+        )
 
-        return [
-            {
-                "id": layer.id,
-                "name": layer.name,
-                "order": layer.order,
-                "completed": layer.id in (self.session.completed_layers if self.session else []),
-            }
-            for layer in layers.layers
-        ]
+        session = self.session
+        completed = session.completed_layers if session else set()
+        return [{**row, "completed": row["id"] in completed} for row in rows]
 
     def list_groups(self, layer_id: str) -> list[dict]:
         """List groups for a layer.
@@ -454,54 +720,162 @@ class PlannerOrchestrator:
         Returns:
             List of group dicts.
         """
-        groups = self.context_builder.load_groups(layer_id)
-        if not groups:
-            return []
+        rows = self._get_listing_rows(
+            self.planning_dir / "groups" / layer_id / "groups.yaml",
+            self._load_groups(layer_id),
+            self._build_group_rows,
+        )
+
+        session = self.session
+        completed = session.completed_groups if session else set()
+        return [{**row, "completed": row["id"] in completed} for row in rows]
+
+    def _get_listing_rows(
+        self,
+        path: Path,
+        definition: Optional[DefinitionT],
+        build: Callable[[DefinitionT], tuple[dict, ...]],
+    ) -> tuple[dict, ...]:
+        """Get the static listing rows for a definition, rebuilding when it is reloaded.
 
-        return [
+        Args:
+            path: Path to the layers or groups YAML file.
+            definition: The current definition from the mtime-checked loaders.
+            build: Builds the rows from the definition.
+
+        Returns:
+            Rows without the per-session "completed" field.
+        """
+        if definition is None:
+            self._listing_cache.pop(path, None)
+            return ()
+
+        # The loaders hand back a new object whenever the file changed
+        cached = self._listing_cache.get(path)
+        if cached is not None and cached[0] is definition:
+            return cached[1]
+
+        rows = build(definition)
+        self._listing_cache[path] = (definition, rows)
+        return rows
+
+    @staticmethod
+    def _build_layer_rows(layers: LayerDefinition) -> tuple[dict, ...]:
+        """Build the static listing rows for all layers."""
+        return tuple(
+            {"id": layer.id, "name": layer.name, "order": layer.order}
+            for layer in layers.layers
+        )
+
+    @staticmethod
+    def _build_group_rows(groups: GroupDefinition) -> tuple[dict, ...]:
+        """Build the static listing rows for a layer's groups."""
+        return tuple(
             {
                 "id": group.id,
                 "name": group.name,
                 "order": group.order,
                 "estimated_tasks": group.estimated_tasks,
-                "completed": group.id in (self.session.completed_groups if self.session else []),
             }
             for group in groups.groups
-        ]
+        )
 
     def _get_tech_names(self, output: ArchitectOutput) -> list[str]:
-        """Extract technology names from architect output."""
-        names = []
-        if output.tech_stack:
-            for fw in output.tech_stack.frameworks.values():
-                names.append(fw.name.lower())
-            if output.tech_stack.database and output.tech_stack.database.orm:
-                names.append(output.tech_stack.database.orm.lower())
-            if output.tech_stack.testing:
-                if output.tech_stack.testing.unit:
-                    names.append(output.tech_stack.testing.unit.lower())
-            for dep in output.tech_stack.dependencies:
-                names.append(dep.name.lower())
-        return names
-
-    def _check_layer_completion(self) -> None:
-        """Check if the current layer is complete."""
-        if not self.session or not self.session.current_layer_id:
-            return
+        """Extract unique technology names from architect output."""
+        # dict keeps first-seen order while deduplicating
+        names: dict[str, None] = {}
+        tech_stack = output.tech_stack
+        if tech_stack:
+            for fw in tech_stack.frameworks.values():
+                names[fw.name.lower()] = None
+            if tech_stack.database and tech_stack.database.orm:
+                names[tech_stack.database.orm.lower()] = None
+            if tech_stack.testing:
+                if tech_stack.testing.unit:
+                    names[tech_stack.testing.unit.lower()] = None
+            for dep in tech_stack.dependencies:
+                names[dep.name.lower()] = None
+        return list(names)
+
+    def _get_phase(self, phase_cls: type[PhaseT]) -> PhaseT:
+        """Get the runner for a phase, creating it on first use for the current model."""
+        key = (phase_cls, self.model)
+        phase = self._phases.get(key)
+        if phase is None:
+            phase = self._phases[key] = phase_cls(self.project_path, self.model)
+        return phase  # type: ignore[return-value]
+
+    def _wait_for_docs(self) -> None:
+        """Wait for a background tech docs fetch to finish."""
+        future = self._pending_docs_future
+        if future is not None:
+            self._pending_docs_future = None
+            future.result()
+
+    def _load_layers(self) -> Optional[LayerDefinition]:
+        """Load the layers definition, reusing the cached copy while layers.yaml is unchanged."""
+        mtime = _mtime_ns(self.planning_dir / "layers.yaml")
+        cached = self._layers_cache
+        if mtime is not None and cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        self._layers_cache = None
+        # Edited layers may be reordered or new, so rescan them from the start
+        self._next_layer_idx = 0
+        if mtime is None:
+            return None
+
+        layers = self.context_builder.load_layers()
+        if layers is not None:
+            self._layers_cache = (mtime, layers)
+        return layers
+
+    def _load_groups(self, layer_id: str) -> Optional[GroupDefinition]:
+        """Load a layer's groups definition, reusing the cached copy while its file is unchanged."""
+        mtime = _mtime_ns(self.planning_dir / "groups" / layer_id / "groups.yaml")
+        cached = self._groups_cache.get(layer_id)
+        if mtime is not None and cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        self._groups_cache.pop(layer_id, None)
+        if mtime is None:
+            return None
 
-        layer_id = self.session.current_layer_id
         groups = self.context_builder.load_groups(layer_id)
+        if groups is not None:
+            self._groups_cache[layer_id] = (mtime, groups)
+        return groups
+
+    def _check_layer_completion(self, layer_id: str) -> None:
+        """Mark a layer complete once all of its groups are complete.
+
+        Args:
+            layer_id: ID of the layer to check.
+        """
+        session = self.session
+        if not session:
+            return
 
-        if not groups:
+        # groups.yaml is authoritative, since it may have been regenerated or edited
+        # by hand; the mtime-checked loader only rereads it when it changed
+        groups = self._load_groups(layer_id)
+        if groups is not None:
+            group_ids = [group.id for group in groups.groups]
+            if session.layer_groups.get(layer_id) != group_ids:
+                session.layer_groups[layer_id] = group_ids
+                self._mark_dirty()
+        else:
+            group_ids = session.layer_groups.get(layer_id, [])
+
+        if not group_ids:
             return
 
         # Check if all groups are complete
-        all_complete = all(
-            group.id in self.session.completed_groups
-            for group in groups.groups
-        )
-
-        if all_complete and layer_id not in self.session.completed_layers:
-            self.session.completed_layers.append(layer_id)
-            self.session.current_layer_id = None
-            self.checkpoint_manager.save_session(self.session)
+        completed = session.completed_groups
+        all_complete = all(group_id in completed for group_id in group_ids)
+
+        if all_complete and layer_id not in session.completed_layers:
+            session.completed_layers.add(layer_id)
+            if session.current_layer_id == layer_id:
+                session.current_layer_id = None
+            self._mark_dirty()
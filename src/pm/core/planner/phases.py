@@ -1,246 +1,205 @@
 """Planning Phases - Phase runners for each stage of multi-phase planning."""
 
+import asyncio
 import re
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Generator, Optional
+from typing import TYPE_CHECKING, Any, Callable, Generator, Iterator, Optional
 
-from pm.core.conversation import ConversationManager
 from pm.core.planner.context import ContextBuilder
+from pm.core.planner.response_cache import PlanCache
 from pm.models.persona import Persona, Specialization
 from pm.models.planner import (
-    CodebaseAnalysis,
-    Group,
-    GroupContract,
     GroupDefinition,
-    Layer,
     LayerDefinition,
     PlanningPhase,
     TechStack,
-    ContractExport,
-    ContractInterface,
 )
-from pm.storage.files import write_yaml_file, ensure_directory
+from pm.storage.files import load_yaml, write_yaml_file, ensure_directory
 
+if TYPE_CHECKING:
+    from pm.core.conversation import ConversationManager
 
-@dataclass
-class PhaseOutput:
-    """Base output from a planning phase."""
-
-    success: bool
-    phase: PlanningPhase
-    message: str = ""
-    artifacts: list[str] = field(default_factory=list)
-    raw_response: str = ""
-
-
-@dataclass
-class ArchitectOutput(PhaseOutput):
-    """Output from the Technical Architect phase."""
-
-    tech_stack: Optional[TechStack] = None
-    layers: Optional[LayerDefinition] = None
-
+# Streamed chunks are forwarded once this many characters, a newline, or
+# this much time has accumulated
+_STREAM_FLUSH_CHARS = 64
+_STREAM_FLUSH_SECONDS = 0.05
 
-@dataclass
-class LayerOutput(PhaseOutput):
-    """Output from the Layer Planner phase."""
-
-    layer_id: str = ""
-    groups: Optional[GroupDefinition] = None
-
-
-@dataclass
-class GroupOutput(PhaseOutput):
-    """Output from the Group Planner phase."""
+# Task ID line at the start of a task file's frontmatter
+_ID_RE = re.compile(r"id:\s*(T-\d+)")
 
-    group_id: str = ""
-    task_ids: list[str] = field(default_factory=list)
 
+def _iter_yaml_blocks(response: str) -> Iterator[str]:
+    """Yield the bodies of fenced YAML blocks in a single pass over the response.
 
-class PhaseRunner(ABC):
-    """Base class for planning phases.
+    Args:
+        response: Raw LLM response text.
 
-    Each phase creates a fresh conversation context, loads relevant
-    artifacts, runs the planning conversation, and saves outputs.
+    Yields:
+        Text between each ```yaml (or ```yml) fence and its closing fence.
     """
+    # Jump between fences with str.find rather than visiting every line
+    pos = 0
+    while (start := response.find("```", pos)) != -1:
+        line_start = response.rfind("\n", 0, start) + 1
+        line_end = response.find("\n", start)
+        if line_end == -1:
+            return
+        pos = line_end + 1
+
+        # Only fences opening a line and tagged yaml/yml start a block
+        lang = response[start + 3 : line_end].strip().lower()
+        if response[line_start:start].strip() or lang not in ("yaml", "yml"):
+            continue
+
+        # The block ends at the first line consisting of a bare fence
+        search = pos
+        while True:
+            close = response.find("```", search)
+            if close == -1:
+                return
+            close_start = response.rfind("\n", 0, close) + 1
+            close_end = response.find("\n", close)
+            if close_end == -1:
+                close_end = len(response)
+            if response[close_start:close_end].strip() == "```":
+                yield response[pos:close_start].rstrip("\r\n")
+                pos = close_end + 1
+                break
+            search = close + 3
+
+
+def _scan_task_ids(response: str) -> list[str]:
+    """Find the IDs of task files in a single pass over the response.
+
+    A task starts with a frontmatter rule followed by an ``id: T-NNN`` line.
+    Tasks opened by a ```markdown fence are preferred; without any, bare
+    tasks count once a "## Done When" checklist item follows them.
+
+    Args:
+        response: Raw LLM response text.
+
+    Returns:
+        Unique task IDs in the order they first appear.
+    """
+    fenced_ids: list[str] = []
+    bare_ids: list[str] = []
+
+    after_fence = False  # previous non-blank line opened a ```markdown block
+    after_rule = False  # previous non-blank line was a "---" rule
+    rule_fenced = False  # that rule directly followed a ```markdown fence
+    candidate: Optional[str] = None  # bare task waiting for its Done When checklist
+    in_done_when = False
+
+    for line in response.splitlines():
+        stripped = line.strip()
+        if not stripped:
+            continue
+
+        if after_rule:
+            after_rule = False
+            id_match = _ID_RE.match(stripped)
+            if id_match:
+                if rule_fenced:
+                    fenced_ids.append(id_match.group(1))
+                else:
+                    candidate = id_match.group(1)
+                    in_done_when = False
+                continue
+
+        if stripped == "---":
+            after_rule = True
+            rule_fenced = after_fence
+            after_fence = False
+            continue
+
+        after_fence = stripped == "```markdown"
+
+        if candidate is not None:
+            if stripped == "## Done When":
+                in_done_when = True
+            elif in_done_when:
+                if stripped.startswith(("- [ ]", "- [x]")):
+                    bare_ids.append(candidate)
+                    candidate = None
+                in_done_when = False
+
+    # A task repeated in the response (e.g. restated after a correction) counts once
+    return list(dict.fromkeys(fenced_ids or bare_ids))
+
+
+# Phase personas, shared by every runner since they are never modified
+_ARCHITECT_PERSONA = Persona(
+    id="planning-architect",
+    name="Technical Architect",
+    specialization=Specialization.ARCHITECT,
+    description="Systematic architect designing scalable systems with clean architecture.",
+    expertise=[
+        "System architecture",
+        "Technology selection",
+        "API design",
+        "Layer decomposition",
+        "Dependency management",
+    ],
+    perspective="Views the system holistically, planning for scalability and maintainability.",
+    tone="Systematic, thorough, security-conscious. Documents decisions clearly.",
+    focus_areas=[
+        "Technology selection",
+        "Architecture layers",
+        "API boundaries",
+        "Data modeling",
+        "Security considerations",
+    ],
+)
 
-    # Default model for planning phases
-    DEFAULT_MODEL = "claude"
-
-    def __init__(
-        self,
-        project_path: Path,
-        model: str = DEFAULT_MODEL,
-        prompt_path: Optional[Path] = None,
-    ):
-        """Initialize the phase runner.
-
-        Args:
-            project_path: Path to the project root.
-            model: Model to use for this phase.
-            prompt_path: Path to the phase-specific prompt file.
-        """
-        self.project_path = project_path
-        self.model = model
-        self.prompt_path = prompt_path
-        self.context_builder = ContextBuilder(project_path)
-        self.planning_dir = project_path / "planning"
-        ensure_directory(self.planning_dir)
-
-    def create_fresh_conversation(self) -> ConversationManager:
-        """Create a fresh conversation for this phase.
-
-        Returns:
-            A new ConversationManager with no history.
-        """
-        conversation = ConversationManager(model=self.model)
-
-        # Set up persona for this phase
-        persona = self._get_phase_persona()
-        if persona:
-            conversation.set_persona(persona)
-
-        return conversation
-
-    @abstractmethod
-    def _get_phase_persona(self) -> Optional[Persona]:
-        """Get the persona for this phase."""
-        pass
-
-    @abstractmethod
-    def _get_phase_prompt(self) -> str:
-        """Get the system/task prompt for this phase."""
-        pass
-
-    @abstractmethod
-    def build_context(self, inputs: dict[str, Any]) -> str:
-        """Build context string from artifacts.
-
-        Args:
-            inputs: Phase-specific input parameters.
-
-        Returns:
-            Context string to include in the prompt.
-        """
-        pass
-
-    @abstractmethod
-    def parse_output(self, response: str) -> PhaseOutput:
-        """Parse the LLM response into structured output.
-
-        Args:
-            response: Raw LLM response text.
-
-        Returns:
-            Parsed phase output.
-        """
-        pass
-
-    @abstractmethod
-    def save_artifacts(self, output: PhaseOutput) -> list[str]:
-        """Save phase outputs as artifacts.
-
-        Args:
-            output: Parsed phase output.
-
-        Returns:
-            List of saved artifact paths.
-        """
-        pass
-
-    def run(
-        self,
-        inputs: dict[str, Any],
-        interactive: bool = True,
-    ) -> Generator[str, Optional[str], PhaseOutput]:
-        """Run this planning phase.
-
-        Args:
-            inputs: Phase-specific input parameters.
-            interactive: Whether to allow interactive Q&A.
-
-        Yields:
-            Response chunks as they arrive.
-
-        Returns:
-            Parsed phase output after completion.
-        """
-        # Create fresh conversation
-        conversation = self.create_fresh_conversation()
-
-        # Build context from artifacts
-        context = self.build_context(inputs)
-
-        # Get phase prompt
-        phase_prompt = self._get_phase_prompt()
-
-        # Build the full prompt
-        full_prompt = f"{context}\n\n---\n\n{phase_prompt}"
-
-        # Run conversation with streaming
-        full_response = ""
-        for chunk in conversation.chat_stream(full_prompt):
-            full_response += chunk
-            yield chunk
-
-        # Parse output
-        output = self.parse_output(full_response)
-        output.raw_response = full_response
-
-        # Save artifacts
-        if output.success:
-            output.artifacts = self.save_artifacts(output)
-
-        return output
-
-    def _load_prompt_file(self) -> str:
-        """Load prompt from file if available."""
-        if self.prompt_path and self.prompt_path.exists():
-            return self.prompt_path.read_text()
-        return ""
-
-
-class TechnicalArchitectPhase(PhaseRunner):
-    """Technical Architect phase - analyzes requirements and defines architecture."""
-
-    def __init__(self, project_path: Path, model: str = PhaseRunner.DEFAULT_MODEL):
-        prompt_path = project_path.parent / "tooling" / "prompts" / "planner" / "architect-phase.md"
-        super().__init__(project_path, model, prompt_path)
+_LAYER_PERSONA = Persona(
+    id="planning-layer",
+    name="Layer Planner",
+    specialization=Specialization.ARCHITECT,
+    description="Decomposes architecture layers into manageable functional groups.",
+    expertise=[
+        "Module decomposition",
+        "Contract design",
+        "Dependency analysis",
+        "Interface definition",
+    ],
+    perspective="Breaks complex layers into cohesive, testable groups.",
+    tone="Analytical, methodical, focused on boundaries and contracts.",
+    focus_areas=[
+        "Group boundaries",
+        "Contract interfaces",
+        "Execution order",
+        "Task estimation",
+    ],
+)
 
-    def _get_phase_persona(self) -> Optional[Persona]:
-        """Get architect persona."""
-        return Persona(
-            id="planning-architect",
-            name="Technical Architect",
-            specialization=Specialization.ARCHITECT,
-            description="Systematic architect designing scalable systems with clean architecture.",
-            expertise=[
-                "System architecture",
-                "Technology selection",
-                "API design",
-                "Layer decomposition",
-                "Dependency management",
-            ],
-            perspective="Views the system holistically, planning for scalability and maintainability.",
-            tone="Systematic, thorough, security-conscious. Documents decisions clearly.",
-            focus_areas=[
-                "Technology selection",
-                "Architecture layers",
-                "API boundaries",
-                "Data modeling",
-                "Security considerations",
-            ],
-        )
+_GROUP_PERSONA = Persona(
+    id="planning-group",
+    name="Task Planner",
+    specialization=Specialization.ENGINEER,
+    description="Creates detailed, executable task specifications.",
+    expertise=[
+        "Task decomposition",
+        "Contract-driven development",
+        "Test specification",
+        "Implementation planning",
+    ],
+    perspective="Breaks groups into precise, testable tasks.",
+    tone="Precise, thorough, test-focused. Every task must be verifiable.",
+    focus_areas=[
+        "Task contracts",
+        "Test specifications",
+        "Verification criteria",
+        "Output files",
+    ],
+)
 
-    def _get_phase_prompt(self) -> str:
-        """Get the architect phase prompt."""
-        file_prompt = self._load_prompt_file()
-        if file_prompt:
-            return file_prompt
 
-        return """# Technical Architect Phase
+# Built-in phase prompts, used when no prompt file overrides them
+_ARCHITECT_DEFAULT_PROMPT = """# Technical Architect Phase
 
 Analyze the provided PRD, features, and requirements to design the system architecture.
 
@@ -334,110 +293,7 @@ layers:
 
 Ask clarifying questions if the requirements are ambiguous."""
 
-    def build_context(self, inputs: dict[str, Any]) -> str:
-        """Build context for architect phase."""
-        codebase_analysis = inputs.get("codebase_analysis")
-        return self.context_builder.build_architect_context(codebase_analysis)
-
-    def parse_output(self, response: str) -> ArchitectOutput:
-        """Parse architect phase output."""
-        import yaml
-
-        output = ArchitectOutput(
-            success=False,
-            phase=PlanningPhase.ARCHITECT,
-        )
-
-        # Extract tech-stack.yaml block
-        tech_stack_match = re.search(
-            r"```ya?ml\s*\n(version:\s*[\"']1\.0[\"'].*?project_type:.*?)```",
-            response,
-            re.DOTALL,
-        )
-        if tech_stack_match:
-            try:
-                tech_data = yaml.safe_load(tech_stack_match.group(1))
-                output.tech_stack = TechStack.from_dict(tech_data)
-            except Exception as e:
-                output.message = f"Failed to parse tech stack: {e}"
-                return output
-
-        # Extract layers.yaml block
-        layers_match = re.search(
-            r"```ya?ml\s*\n(version:\s*[\"']1\.0[\"'].*?architect_summary:.*?layers:.*?)```",
-            response,
-            re.DOTALL,
-        )
-        if layers_match:
-            try:
-                layers_data = yaml.safe_load(layers_match.group(1))
-                output.layers = LayerDefinition.from_dict(layers_data)
-            except Exception as e:
-                output.message = f"Failed to parse layers: {e}"
-                return output
-
-        if output.tech_stack and output.layers:
-            output.success = True
-            output.message = f"Architecture defined: {len(output.layers.layers)} layers"
-        else:
-            output.message = "Could not parse architecture output. Expected tech-stack and layers YAML blocks."
-
-        return output
-
-    def save_artifacts(self, output: ArchitectOutput) -> list[str]:
-        """Save architect phase artifacts."""
-        saved = []
-
-        if output.tech_stack:
-            tech_path = self.planning_dir / "tech-stack.yaml"
-            write_yaml_file(tech_path, output.tech_stack.to_dict())
-            saved.append(str(tech_path))
-
-        if output.layers:
-            layers_path = self.planning_dir / "layers.yaml"
-            write_yaml_file(layers_path, output.layers.to_dict())
-            saved.append(str(layers_path))
-
-        return saved
-
-
-class LayerPlannerPhase(PhaseRunner):
-    """Layer Planner phase - breaks a layer into functional groups."""
-
-    def __init__(self, project_path: Path, model: str = PhaseRunner.DEFAULT_MODEL):
-        prompt_path = project_path.parent / "tooling" / "prompts" / "planner" / "layer-planner.md"
-        super().__init__(project_path, model, prompt_path)
-
-    def _get_phase_persona(self) -> Optional[Persona]:
-        """Get layer planner persona."""
-        return Persona(
-            id="planning-layer",
-            name="Layer Planner",
-            specialization=Specialization.ARCHITECT,
-            description="Decomposes architecture layers into manageable functional groups.",
-            expertise=[
-                "Module decomposition",
-                "Contract design",
-                "Dependency analysis",
-                "Interface definition",
-            ],
-            perspective="Breaks complex layers into cohesive, testable groups.",
-            tone="Analytical, methodical, focused on boundaries and contracts.",
-            focus_areas=[
-                "Group boundaries",
-                "Contract interfaces",
-                "Execution order",
-                "Task estimation",
-            ],
-        )
-
-    def _get_phase_prompt(self) -> str:
-        """Get the layer planner prompt."""
-        file_prompt = self._load_prompt_file()
-        if file_prompt:
-            return file_prompt
-
-        return """# Layer Planner Phase
+_LAYER_DEFAULT_PROMPT = """# Layer Planner Phase
 
 Break down the specified layer into functional groups that can be implemented independently.
 
@@ -501,100 +357,16 @@ execution_order:
 
 Ask clarifying questions if needed."""
 
-    def build_context(self, inputs: dict[str, Any]) -> str:
-        """Build context for layer planning."""
-        layer_id = inputs.get("layer_id", "")
-        return self.context_builder.build_layer_context(layer_id)
+_GROUP_DEFAULT_PROMPT = """# Group Planner Phase
 
-    def parse_output(self, response: str) -> LayerOutput:
-        """Parse layer planner output."""
-        import yaml
+Create detailed task files for implementing the specified group.
 
-        output = LayerOutput(
-            success=False,
-            phase=PlanningPhase.LAYER_PLANNING,
-        )
+## Your Tasks
 
-        # Extract groups.yaml block
-        groups_match = re.search(
-            r"```ya?ml\s*\n(version:\s*[\"']1\.0[\"'].*?layer_id:.*?groups:.*?)```",
-            response,
-            re.DOTALL,
-        )
-        if groups_match:
-            try:
-                groups_data = yaml.safe_load(groups_match.group(1))
-                output.groups = GroupDefinition.from_dict(groups_data)
-                output.layer_id = groups_data.get("layer_id", "")
-                output.success = True
-                output.message = f"Layer breakdown: {len(output.groups.groups)} groups"
-            except Exception as e:
-                output.message = f"Failed to parse groups: {e}"
-        else:
-            output.message = "Could not parse layer output. Expected groups YAML block."
-
-        return output
-
-    def save_artifacts(self, output: LayerOutput) -> list[str]:
-        """Save layer planner artifacts."""
-        saved = []
-
-        if output.groups and output.layer_id:
-            groups_dir = self.planning_dir / "groups" / output.layer_id
-            ensure_directory(groups_dir)
-            groups_path = groups_dir / "groups.yaml"
-            write_yaml_file(groups_path, output.groups.to_dict())
-            saved.append(str(groups_path))
-
-        return saved
-
-
-class GroupPlannerPhase(PhaseRunner):
-    """Group Planner phase - creates executable task files for a group."""
-
-    def __init__(self, project_path: Path, model: str = PhaseRunner.DEFAULT_MODEL):
-        prompt_path = project_path.parent / "tooling" / "prompts" / "planner" / "group-planner.md"
-        super().__init__(project_path, model, prompt_path)
-
-    def _get_phase_persona(self) -> Optional[Persona]:
-        """Get group planner persona."""
-        return Persona(
-            id="planning-group",
-            name="Task Planner",
-            specialization=Specialization.ENGINEER,
-            description="Creates detailed, executable task specifications.",
-            expertise=[
-                "Task decomposition",
-                "Contract-driven development",
-                "Test specification",
-                "Implementation planning",
-            ],
-            perspective="Breaks groups into precise, testable tasks.",
-            tone="Precise, thorough, test-focused. Every task must be verifiable.",
-            focus_areas=[
-                "Task contracts",
-                "Test specifications",
-                "Verification criteria",
-                "Output files",
-            ],
-        )
-
-    def _get_phase_prompt(self) -> str:
-        """Get the group planner prompt."""
-        file_prompt = self._load_prompt_file()
-        if file_prompt:
-            return file_prompt
-
-        return """# Group Planner Phase
-
-Create detailed task files for implementing the specified group.
-
-## Your Tasks
-
-1. **Break Into Tasks**
-   - Create 2-8 tasks for this group
-   - Each task should be independently executable
-   - Tasks should have clear contracts and verification
+1. **Break Into Tasks**
+   - Create 2-8 tasks for this group
+   - Each task should be independently executable
+   - Tasks should have clear contracts and verification
 
 2. **Define Contracts**
    - Specify exactly what each task exports
@@ -681,6 +453,450 @@ npx vitest run <test file>
 
 Generate all tasks for this group."""
 
+
+@lru_cache(maxsize=16)
+def _get_context_builder(project_path: Path) -> ContextBuilder:
+    """Get the shared context builder for a project."""
+    return ContextBuilder(project_path)
+
+
+@dataclass(slots=True, eq=False)
+class PhaseOutput:
+    """Base output from a planning phase."""
+
+    success: bool
+    phase: PlanningPhase
+    message: str = ""
+    artifacts: list[str] = field(default_factory=list)
+    raw_response: str = ""
+    # Response cache key of the response this output was parsed from
+    cache_key: str = ""
+
+
+@dataclass(slots=True, eq=False)
+class ArchitectOutput(PhaseOutput):
+    """Output from the Technical Architect phase."""
+
+    tech_stack: Optional[TechStack] = None
+    layers: Optional[LayerDefinition] = None
+
+
+@dataclass(slots=True, eq=False)
+class LayerOutput(PhaseOutput):
+    """Output from the Layer Planner phase."""
+
+    layer_id: str = ""
+    groups: Optional[GroupDefinition] = None
+
+
+@dataclass(slots=True, eq=False)
+class GroupOutput(PhaseOutput):
+    """Output from the Group Planner phase."""
+
+    group_id: str = ""
+    task_ids: list[str] = field(default_factory=list)
+
+
+class PhaseRunner(ABC):
+    """Base class for planning phases.
+
+    Each phase creates a fresh conversation context, loads relevant
+    artifacts, runs the planning conversation, and saves outputs.
+    """
+
+    # Default model for planning phases
+    DEFAULT_MODEL = "claude"
+
+    # Keep the full response text on successful outputs (useful when debugging prompts)
+    KEEP_RAW_RESPONSE = False
+
+    def __init__(
+        self,
+        project_path: Path,
+        model: str = DEFAULT_MODEL,
+        prompt_path: Optional[Path] = None,
+    ):
+        """Initialize the phase runner.
+
+        Args:
+            project_path: Path to the project root.
+            model: Model to use for this phase.
+            prompt_path: Path to the phase-specific prompt file.
+        """
+        self.project_path = project_path
+        self.model = model
+        self.prompt_path = prompt_path
+        # Prompt file contents with the mtime they were read at
+        self._prompt_cache: Optional[tuple[int, str]] = None
+        self.context_builder = _get_context_builder(project_path)
+        self.response_cache = PlanCache(project_path)
+        self.planning_dir = project_path / "planning"
+        ensure_directory(self.planning_dir)
+
+    def create_fresh_conversation(self) -> "ConversationManager":
+        """Create a fresh conversation for this phase.
+
+        Returns:
+            A new ConversationManager with no history.
+        """
+        # Imported here so defining phases does not load the LLM client SDK
+        from pm.core.conversation import ConversationManager
+
+        conversation = ConversationManager(model=self.model)
+
+        # Set up persona for this phase
+        persona = self._get_phase_persona()
+        if persona:
+            conversation.set_persona(persona)
+
+        return conversation
+
+    @abstractmethod
+    def _get_phase_persona(self) -> Optional[Persona]:
+        """Get the persona for this phase."""
+        pass
+
+    @abstractmethod
+    def _get_phase_prompt(self) -> str:
+        """Get the system/task prompt for this phase."""
+        pass
+
+    @abstractmethod
+    def build_context(self, inputs: dict[str, Any]) -> str:
+        """Build context string from artifacts.
+
+        Args:
+            inputs: Phase-specific input parameters.
+
+        Returns:
+            Context string to include in the prompt.
+        """
+        pass
+
+    @abstractmethod
+    def parse_output(self, response: str) -> PhaseOutput:
+        """Parse the LLM response into structured output.
+
+        Args:
+            response: Raw LLM response text.
+
+        Returns:
+            Parsed phase output.
+        """
+        pass
+
+    @abstractmethod
+    def save_artifacts(self, output: PhaseOutput) -> list[str]:
+        """Save phase outputs as artifacts.
+
+        Args:
+            output: Parsed phase output.
+
+        Returns:
+            List of saved artifact paths.
+        """
+        pass
+
+    def run(
+        self,
+        inputs: dict[str, Any],
+        interactive: bool = True,
+        fresh: bool = False,
+    ) -> Generator[str, Optional[str], PhaseOutput]:
+        """Run this planning phase.
+
+        Args:
+            inputs: Phase-specific input parameters.
+            interactive: Whether to allow interactive Q&A.
+            fresh: Ask the LLM even if a response to this prompt is cached.
+                The new response replaces the cached one.
+
+        Yields:
+            Response chunks as they arrive.
+
+        Returns:
+            Parsed phase output after completion.
+        """
+        # Build context from artifacts
+        context = self.build_context(inputs)
+
+        # Get phase prompt
+        phase_prompt = self._get_phase_prompt()
+
+        # Build the full prompt
+        full_prompt = f"{context}\n\n---\n\n{phase_prompt}"
+
+        # Replay a cached response for an identical prompt, otherwise ask the LLM
+        scope = (type(self).__name__, inputs.get("layer_id") or "", inputs.get("group_id") or "")
+        cache_key = PlanCache.make_key(self.model, full_prompt, scope)
+        cached_response = None if fresh else self.response_cache.get(cache_key)
+        if cached_response is not None:
+            yield from cached_response.splitlines(keepends=True)
+            full_response = cached_response
+        else:
+            full_response = yield from self._stream_response(full_prompt)
+
+        # Parse output
+        output = self.parse_output(full_response)
+        output.cache_key = cache_key
+
+        # Successful responses live in the response cache, so only keep the
+        # text in memory when it failed to parse or when asked to
+        if self.KEEP_RAW_RESPONSE or not output.success:
+            output.raw_response = full_response
+
+        # Save artifacts
+        if output.success:
+            output.artifacts = self.save_artifacts(output)
+            if cached_response is None:
+                self.response_cache.put(cache_key, output.phase, full_response)
+
+        return output
+
+    async def arun(
+        self,
+        inputs: dict[str, Any],
+        on_chunk: Optional[Callable[[str], None]] = None,
+        fresh: bool = False,
+    ) -> PhaseOutput:
+        """Run this planning phase in a worker thread.
+
+        Independent runs, such as groups with no mutual dependencies, can be
+        awaited together with asyncio.gather() so their LLM streams overlap.
+
+        Args:
+            inputs: Phase-specific input parameters.
+            on_chunk: Optional callback receiving response chunks as they arrive.
+                Called from the worker thread.
+            fresh: Ask the LLM even if a response to this prompt is cached.
+
+        Returns:
+            Parsed phase output after completion.
+        """
+        return await asyncio.to_thread(self._run_to_completion, inputs, on_chunk, fresh)
+
+    def _run_to_completion(
+        self,
+        inputs: dict[str, Any],
+        on_chunk: Optional[Callable[[str], None]],
+        fresh: bool,
+    ) -> PhaseOutput:
+        """Drive run() to completion, forwarding chunks to a callback."""
+        stream = self.run(inputs, fresh=fresh)
+        while True:
+            try:
+                chunk = next(stream)
+            except StopIteration as stop:
+                return stop.value
+            if on_chunk is not None:
+                on_chunk(chunk)
+
+    def _stream_response(self, full_prompt: str) -> Generator[str, None, str]:
+        """Send the prompt to a fresh conversation and stream the response.
+
+        Args:
+            full_prompt: Complete prompt for this phase.
+
+        Yields:
+            Response text, with small chunks forwarded in batches.
+
+        Returns:
+            The full response text.
+        """
+        conversation = self.create_fresh_conversation()
+
+        parts: list[str] = []
+        pending: list[str] = []
+        pending_len = 0
+        last_flush = time.monotonic()
+        for chunk in conversation.chat_stream(full_prompt):
+            parts.append(chunk)
+            pending.append(chunk)
+            pending_len += len(chunk)
+            now = time.monotonic()
+            if (
+                pending_len >= _STREAM_FLUSH_CHARS
+                or "\n" in chunk
+                or now - last_flush >= _STREAM_FLUSH_SECONDS
+            ):
+                yield "".join(pending)
+                pending.clear()
+                pending_len = 0
+                last_flush = now
+        if pending:
+            yield "".join(pending)
+
+        return "".join(parts)
+
+    def _load_prompt_file(self) -> str:
+        """Load prompt from file if available, rereading it only when it has changed."""
+        if not self.prompt_path:
+            return ""
+
+        try:
+            mtime = self.prompt_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._prompt_cache = None
+            return ""
+
+        cached = self._prompt_cache
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        prompt = self.prompt_path.read_text()
+        self._prompt_cache = (mtime, prompt)
+        return prompt
+
+
+class TechnicalArchitectPhase(PhaseRunner):
+    """Technical Architect phase - analyzes requirements and defines architecture."""
+
+    def __init__(self, project_path: Path, model: str = PhaseRunner.DEFAULT_MODEL):
+        prompt_path = project_path.parent / "tooling" / "prompts" / "planner" / "architect-phase.md"
+        super().__init__(project_path, model, prompt_path)
+
+    def _get_phase_persona(self) -> Optional[Persona]:
+        """Get architect persona."""
+        return _ARCHITECT_PERSONA
+
+    def _get_phase_prompt(self) -> str:
+        """Get the architect phase prompt."""
+        return self._load_prompt_file() or _ARCHITECT_DEFAULT_PROMPT
+
+    def build_context(self, inputs: dict[str, Any]) -> str:
+        """Build context for architect phase."""
+        codebase_analysis = inputs.get("codebase_analysis")
+        return self.context_builder.build_architect_context(codebase_analysis)
+
+    def parse_output(self, response: str) -> ArchitectOutput:
+        """Parse architect phase output."""
+        output = ArchitectOutput(
+            success=False,
+            phase=PlanningPhase.ARCHITECT,
+        )
+
+        # Clarifying questions come back without any fenced blocks
+        if "```" not in response:
+            output.message = "No YAML blocks found in architecture output."
+            return output
+
+        # Route each YAML block to tech-stack.yaml or layers.yaml by its keys
+        for block in _iter_yaml_blocks(response):
+            if output.layers is None and "architect_summary:" in block and "layers:" in block:
+                try:
+                    layers_data = load_yaml(block)
+                    output.layers = LayerDefinition.from_dict(layers_data)
+                except Exception as e:
+                    output.message = f"Failed to parse layers: {e}"
+                    return output
+            elif output.tech_stack is None and "project_type:" in block:
+                try:
+                    tech_data = load_yaml(block)
+                    output.tech_stack = TechStack.from_dict(tech_data)
+                except Exception as e:
+                    output.message = f"Failed to parse tech stack: {e}"
+                    return output
+
+        if output.tech_stack and output.layers:
+            output.success = True
+            output.message = f"Architecture defined: {len(output.layers.layers)} layers"
+        else:
+            output.message = "Could not parse architecture output. Expected tech-stack and layers YAML blocks."
+
+        return output
+
+    def save_artifacts(self, output: ArchitectOutput) -> list[str]:
+        """Save architect phase artifacts."""
+        saved = []
+
+        if output.tech_stack:
+            tech_path = self.planning_dir / "tech-stack.yaml"
+            write_yaml_file(tech_path, output.tech_stack.to_dict())
+            saved.append(str(tech_path))
+
+        if output.layers:
+            layers_path = self.planning_dir / "layers.yaml"
+            write_yaml_file(layers_path, output.layers.to_dict())
+            saved.append(str(layers_path))
+
+        return saved
+
+
+class LayerPlannerPhase(PhaseRunner):
+    """Layer Planner phase - breaks a layer into functional groups."""
+
+    def __init__(self, project_path: Path, model: str = PhaseRunner.DEFAULT_MODEL):
+        prompt_path = project_path.parent / "tooling" / "prompts" / "planner" / "layer-planner.md"
+        super().__init__(project_path, model, prompt_path)
+
+    def _get_phase_persona(self) -> Optional[Persona]:
+        """Get layer planner persona."""
+        return _LAYER_PERSONA
+
+    def _get_phase_prompt(self) -> str:
+        """Get the layer planner prompt."""
+        return self._load_prompt_file() or _LAYER_DEFAULT_PROMPT
+
+    def build_context(self, inputs: dict[str, Any]) -> str:
+        """Build context for layer planning."""
+        layer_id = inputs.get("layer_id", "")
+        return self.context_builder.build_layer_context(layer_id)
+
+    def parse_output(self, response: str) -> LayerOutput:
+        """Parse layer planner output."""
+        output = LayerOutput(
+            success=False,
+            phase=PlanningPhase.LAYER_PLANNING,
+        )
+
+        # Extract groups.yaml block
+        groups_block = next(
+            (b for b in _iter_yaml_blocks(response) if "layer_id:" in b and "groups:" in b),
+            None,
+        )
+        if groups_block is not None:
+            try:
+                groups_data = load_yaml(groups_block)
+                output.groups = GroupDefinition.from_dict(groups_data)
+                output.layer_id = groups_data.get("layer_id", "")
+                output.success = True
+                output.message = f"Layer breakdown: {len(output.groups.groups)} groups"
+            except Exception as e:
+                output.message = f"Failed to parse groups: {e}"
+        else:
+            output.message = "Could not parse layer output. Expected groups YAML block."
+
+        return output
+
+    def save_artifacts(self, output: LayerOutput) -> list[str]:
+        """Save layer planner artifacts."""
+        saved = []
+
+        if output.groups and output.layer_id:
+            groups_dir = self.planning_dir / "groups" / output.layer_id
+            ensure_directory(groups_dir)
+            groups_path = groups_dir / "groups.yaml"
+            write_yaml_file(groups_path, output.groups.to_dict())
+            saved.append(str(groups_path))
+
+        return saved
+
+
+class GroupPlannerPhase(PhaseRunner):
+    """Group Planner phase - creates executable task files for a group."""
+
+    def __init__(self, project_path: Path, model: str = PhaseRunner.DEFAULT_MODEL):
+        prompt_path = project_path.parent / "tooling" / "prompts" / "planner" / "group-planner.md"
+        super().__init__(project_path, model, prompt_path)
+
+    def _get_phase_persona(self) -> Optional[Persona]:
+        """Get group planner persona."""
+        return _GROUP_PERSONA
+
+    def _get_phase_prompt(self) -> str:
+        """Get the group planner prompt."""
+        return self._load_prompt_file() or _GROUP_DEFAULT_PROMPT
+
     def build_context(self, inputs: dict[str, Any]) -> str:
         """Build context for group planning."""
         layer_id = inputs.get("layer_id", "")
@@ -694,22 +910,11 @@ Generate all tasks for this group."""
             phase=PlanningPhase.GROUP_PLANNING,
         )
 
-        # Extract task markdown blocks
-        task_pattern = r"```markdown\s*\n(---\s*\nid:\s*T-\d+.*?```)\s*```"
-        task_matches = re.findall(task_pattern, response, re.DOTALL)
-
-        if not task_matches:
-            # Try alternative pattern without outer markdown fence
-            task_pattern = r"(---\s*\nid:\s*T-\d+.*?## Done When\s*\n(?:- \[[ x]\].*\n?)+)"
-            task_matches = re.findall(task_pattern, response, re.DOTALL)
-
-        if task_matches:
-            for match in task_matches:
-                # Extract task ID from frontmatter
-                id_match = re.search(r"id:\s*(T-\d+)", match)
-                if id_match:
-                    output.task_ids.append(id_match.group(1))
+        # Extract task IDs from the task file blocks
+        task_ids = _scan_task_ids(response)
 
+        if task_ids:
+            output.task_ids = task_ids
             output.success = True
             output.message = f"Created {len(output.task_ids)} tasks"
         else:
@@ -0,0 +1,109 @@
+"""Response Cache - Reuses LLM responses for repeated planning prompts."""
+
+import hashlib
+import sqlite3
+import time
+from contextlib import closing, contextmanager
+from pathlib import Path
+from typing import Iterator, Optional
+
+from pm.models.planner import PlanningPhase
+
+
+class PlanCache:
+    """Exact-match cache of planning phase responses.
+
+    Responses are keyed by a hash of the model, the phase and the layer or
+    group it ran for, and the full prompt, so re-running a phase over
+    unchanged artifacts replays the previous response instead of calling
+    the LLM again. Only responses that parsed successfully are stored,
+    rejecting a checkpoint evicts the response it was created from, and a step that is retried because the previous run
+    did not advance the plan asks the LLM again.
+    """
+
+    def __init__(self, project_path: Path):
+        """Initialize the response cache.
+
+        Args:
+            project_path: Path to the project root.
+        """
+        self.planning_dir = project_path / "planning"
+        self.cache_file = self.planning_dir / ".cache.sqlite"
+
+    @staticmethod
+    def make_key(model: str, prompt: str, scope: tuple[str, ...] = ()) -> str:
+        """Build the cache key for a prompt sent to a model.
+
+        Args:
+            model: Model the prompt is sent to.
+            prompt: Full prompt text.
+            scope: What the prompt was built for, such as the phase and the
+                layer or group ID. Prompts that happen to be identical for
+                different groups must not share a response.
+
+        Returns:
+            Hex digest identifying the response.
+        """
+        parts = (model, *scope, prompt)
+        return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Get a cached response.
+
+        Args:
+            key: Key from make_key().
+
+        Returns:
+            The cached response, or None on a miss.
+        """
+        if not self.cache_file.exists():
+            return None
+
+        with self._connect() as conn:
+            row = conn.execute("SELECT response FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            conn.execute("UPDATE responses SET used_at = ? WHERE key = ?", (time.time(), key))
+        return row[0]
+
+    def put(self, key: str, phase: PlanningPhase, response: str) -> None:
+        """Store a response.
+
+        Args:
+            key: Key from make_key().
+            phase: Phase that produced the response.
+            response: Full response text.
+        """
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, phase, response, used_at) VALUES (?, ?, ?, ?)",
+                (key, phase.value, response, time.time()),
+            )
+
+    def discard(self, key: str) -> None:
+        """Evict a response.
+
+        Called when the checkpoint created from it is rejected, so re-running
+        the phase asks the LLM again instead of replaying the rejected response.
+
+        Args:
+            key: Key from make_key().
+        """
+        if not self.cache_file.exists():
+            return
+
+        with self._connect() as conn:
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open the cache database for one transaction."""
+        self.planning_dir.mkdir(parents=True, exist_ok=True)
+        with closing(sqlite3.connect(self.cache_file)) as conn:
+            with conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS responses ("
+                    "key TEXT PRIMARY KEY, phase TEXT NOT NULL, "
+                    "response TEXT NOT NULL, used_at REAL NOT NULL)"
+                )
+                yield conn
@@ -1,11 +1,40 @@
 """Project Manager - handles project lifecycle and state."""
 
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 from pm.models.project import Project, ProjectStatus
 from pm.storage.files import read_yaml_file, write_yaml_file, slugify, ensure_directory
 
+# Standard project layout; parents of nested entries are created along with them
+_PROJECT_DIRS = (
+    "prd/sections",
+    "features",
+    "requirements/functional",
+    "requirements/non-functional",
+    "design/personas",
+    "design/journeys",
+    "design/wireframes",
+    "design/interactions",
+    "design/design-system",
+    "architecture/adrs",
+    "architecture/components",
+    "api",
+    "data-models",
+    "tasks",
+    "execution/logs",
+    "execution/reviews",
+    "memory",
+)
+
+
+@lru_cache(maxsize=64)
+def _project_path(projects_dir: Path, project_id: str) -> Path:
+    """Join a project ID onto the projects directory, reusing earlier results."""
+    return projects_dir / project_id
+
 
 class ProjectManager:
     """Manages product management projects."""
@@ -15,6 +44,8 @@ class ProjectManager:
         self.base_path = base_path
         self.projects_dir = base_path / "projects"
         self._current_project: Optional[Project] = None
+        # Parsed .project.yaml data keyed by path, with the mtime it was read at
+        self._project_cache: dict[Path, tuple[int, dict]] = {}
         ensure_directory(self.projects_dir)
 
     @property
@@ -45,27 +76,9 @@ class ProjectManager:
 
     def _create_project_structure(self, project_dir: Path) -> None:
         """Create the standard project directory structure."""
-        dirs = [
-            "prd/sections",
-            "features",
-            "requirements/functional",
-            "requirements/non-functional",
-            "design/personas",
-            "design/journeys",
-            "design/wireframes",
-            "design/interactions",
-            "design/design-system",
-            "architecture/adrs",
-            "architecture/components",
-            "api",
-            "data-models",
-            "tasks",
-            "execution/logs",
-            "execution/reviews",
-            "memory",
-        ]
-        for dir_path in dirs:
-            ensure_directory(project_dir / dir_path)
+        root = os.fspath(project_dir)
+        for dir_path in _PROJECT_DIRS:
+            os.makedirs(os.path.join(root, dir_path), exist_ok=True)
 
         # Create initial overview file
         overview = project_dir / "overview.md"
@@ -77,24 +90,45 @@ class ProjectManager:
         if not self.projects_dir.exists():
             return projects
 
-        for project_dir in self.projects_dir.iterdir():
-            if project_dir.is_dir():
-                meta_file = project_dir / ".project.yaml"
-                if meta_file.exists():
-                    data = read_yaml_file(meta_file)
-                    projects.append(Project.from_dict(data))
+        # scandir reports entry types from the directory listing, saving a stat per entry
+        with os.scandir(self.projects_dir) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    project = self._load_project(Path(entry.path) / ".project.yaml")
+                    if project is not None:
+                        projects.append(project)
 
         return sorted(projects, key=lambda p: p.updated, reverse=True)
 
     def get_project(self, project_id: str) -> Optional[Project]:
         """Get a project by ID."""
         project_dir = self.projects_dir / project_id
-        meta_file = project_dir / ".project.yaml"
+        return self._load_project(project_dir / ".project.yaml")
+
+    def _load_project(self, meta_file: Path) -> Optional[Project]:
+        """Load project metadata, rereading only when the file has changed.
+
+        Each call builds a new Project from the cached data, so callers can
+        modify the result without affecting other lookups.
+
+        Args:
+            meta_file: Path to the project's .project.yaml.
 
-        if not meta_file.exists():
+        Returns:
+            The project, or None if the metadata file does not exist.
+        """
+        try:
+            mtime = meta_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._project_cache.pop(meta_file, None)
             return None
 
+        cached = self._project_cache.get(meta_file)
+        if cached is not None and cached[0] == mtime:
+            return Project.from_dict(cached[1])
+
         data = read_yaml_file(meta_file)
+        self._project_cache[meta_file] = (mtime, data)
         return Project.from_dict(data)
 
     def switch_project(self, project_id: str) -> Project:
@@ -112,7 +146,11 @@ class ProjectManager:
 
         project.updated = datetime.now()
         project_dir = self.projects_dir / project.id
-        write_yaml_file(project_dir / ".project.yaml", project.to_dict())
+        meta_file = project_dir / ".project.yaml"
+        data = project.to_dict()
+        write_yaml_file(meta_file, data)
+        # Keep the cache current even if the write lands within the same mtime tick
+        self._project_cache[meta_file] = (meta_file.stat().st_mtime_ns, data)
 
         if self._current_project and self._current_project.id == project.id:
             self._current_project = project
@@ -122,6 +160,10 @@ class ProjectManager:
         if not self._current_project:
             raise ValueError("No project selected")
 
+        # Re-setting the current status is a no-op: no write and no bump of updated
+        if self._current_project.status == status:
+            return
+
         self._current_project.status = status
         self.update_project(self._current_project)
 
@@ -132,4 +174,4 @@ class ProjectManager:
                 raise ValueError("No project selected")
             project_id = self._current_project.id
 
-        return self.projects_dir / project_id
+        return _project_path(self.projects_dir, project_id)
@@ -0,0 +1,21 @@
+"""Enum lookup helpers shared by the model modules."""
+
+from enum import Enum
+from typing import TypeVar
+
+E = TypeVar("E", bound=Enum)
+
+
+def _members_by_value(cls: type[E]) -> dict[str, E]:
+    """Build a value -> member map so loading models skips the Enum constructor."""
+    return {member.value: member for member in cls}
+
+
+def _enum_member(members: dict[str, E], cls: type[E], value: str) -> E:
+    """Look up an enum member by value.
+
+    Unknown values fall through to the Enum constructor so they still raise
+    the usual ValueError.
+    """
+    member = members.get(value)
+    return member if member is not None else cls(value)
@@ -1,10 +1,20 @@
 """Artifact data models."""
 
+import re
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from typing import Optional
 
+from pm.models._enums import _enum_member, _members_by_value
+
+# "## " headings that split markdown bodies into sections
+_SECTION_HEADING_RE = re.compile(r"^## .*$", re.MULTILINE)
+
+# "- [ ] item" / "- [x] item" checklist lines, capturing the item text
+_CHECKLIST_ITEM_RE = re.compile(r"^[ \t]*- \[[ x]\] (.*?\S)[ \t\r]*$", re.MULTILINE)
+
 
 class ArtifactStatus(str, Enum):
     """Status for trackable artifacts."""
@@ -51,7 +61,38 @@ class Priority(str, Enum):
     WONT = "wont"
 
 
-@dataclass
+_ARTIFACT_STATUS_BY_VALUE = _members_by_value(ArtifactStatus)
+_TASK_STATUS_BY_VALUE = _members_by_value(TaskStatus)
+_TASK_COMPLEXITY_BY_VALUE = _members_by_value(TaskComplexity)
+_TASK_TRACK_BY_VALUE = _members_by_value(TaskTrack)
+_PRIORITY_BY_VALUE = _members_by_value(Priority)
+
+
+def _iso_timestamps(artifact: "Feature | Requirement | Task") -> tuple[str, str]:
+    """Get the artifact's created/updated timestamps as ISO strings.
+
+    The strings are cached on the artifact and rebuilt only when either
+    datetime has been reassigned since the last call.
+
+    Args:
+        artifact: Artifact with created, updated and _iso_cache slots.
+
+    Returns:
+        Tuple of (created, updated) ISO strings.
+    """
+    cache = artifact._iso_cache
+    if cache is None or cache[0] is not artifact.created or cache[1] is not artifact.updated:
+        cache = (
+            artifact.created,
+            artifact.updated,
+            artifact.created.isoformat(),
+            artifact.updated.isoformat(),
+        )
+        artifact._iso_cache = cache
+    return cache[2], cache[3]
+
+
+@dataclass(slots=True)
 class Feature:
     """A product feature."""
 
@@ -65,41 +106,41 @@ class Feature:
     requirements: list[str] = field(default_factory=list)
     user_stories: str = ""
     acceptance_criteria: list[str] = field(default_factory=list)
+    _iso_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
 
     def to_frontmatter(self) -> dict:
         """Convert to YAML frontmatter dict."""
+        created, updated = _iso_timestamps(self)
         return {
             "id": self.id,
             "title": self.title,
-            "status": self.status.value,
-            "priority": self.priority.value,
-            "created": self.created.isoformat(),
-            "updated": self.updated.isoformat(),
+            "status": self.status,
+            "priority": self.priority,
+            "created": created,
+            "updated": updated,
             "requirements": self.requirements,
         }
 
     def to_markdown(self) -> str:
         """Generate markdown body."""
-        lines = [
-            f"# {self.title}",
-            "",
-            "## Description",
-            "",
-            self.description or "[Feature description]",
-            "",
-            "## User Stories",
-            "",
-            self.user_stories or "[User stories]",
-            "",
-            "## Acceptance Criteria",
-            "",
-        ]
-        if self.acceptance_criteria:
-            for criterion in self.acceptance_criteria:
-                lines.append(f"- [ ] {criterion}")
-        else:
-            lines.append("- [ ] [Criterion 1]")
-        return "\n".join(lines)
+        criteria = (
+            "\n".join(f"- [ ] {c}" for c in self.acceptance_criteria) or "- [ ] [Criterion 1]"
+        )
+        return (
+            f"# {self.title}\n"
+            "\n"
+            "## Description\n"
+            "\n"
+            f"{self.description or '[Feature description]'}\n"
+            "\n"
+            "## User Stories\n"
+            "\n"
+            f"{self.user_stories or '[User stories]'}\n"
+            "\n"
+            "## Acceptance Criteria\n"
+            "\n"
+            f"{criteria}"
+        )
 
     @classmethod
     def from_frontmatter(cls, frontmatter: dict, content: str) -> "Feature":
@@ -108,8 +149,12 @@ class Feature:
             id=frontmatter["id"],
             title=frontmatter["title"],
             description=_extract_section(content, "Description"),
-            status=ArtifactStatus(frontmatter.get("status", "draft")),
-            priority=Priority(frontmatter.get("priority", "should")),
+            status=_enum_member(
+                _ARTIFACT_STATUS_BY_VALUE, ArtifactStatus, frontmatter.get("status", "draft")
+            ),
+            priority=_enum_member(
+                _PRIORITY_BY_VALUE, Priority, frontmatter.get("priority", "should")
+            ),
             created=datetime.fromisoformat(frontmatter["created"]),
             updated=datetime.fromisoformat(frontmatter["updated"]),
             requirements=frontmatter.get("requirements", []),
@@ -118,7 +163,7 @@ class Feature:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Requirement:
     """A functional or non-functional requirement."""
 
@@ -134,42 +179,42 @@ class Requirement:
     tasks: list[str] = field(default_factory=list)
     acceptance_criteria: list[str] = field(default_factory=list)
     is_functional: bool = True
+    _iso_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
 
     def to_frontmatter(self) -> dict:
         """Convert to YAML frontmatter dict."""
+        created, updated = _iso_timestamps(self)
         return {
             "id": self.id,
             "title": self.title,
-            "status": self.status.value,
-            "priority": self.priority.value,
+            "status": self.status,
+            "priority": self.priority,
             "feature": self.feature,
-            "created": self.created.isoformat(),
-            "updated": self.updated.isoformat(),
+            "created": created,
+            "updated": updated,
             "tasks": self.tasks,
         }
 
     def to_markdown(self) -> str:
         """Generate markdown body."""
-        lines = [
-            f"# {self.title}",
-            "",
-            "## Description",
-            "",
-            self.description or "[Requirement description]",
-            "",
-            "## Rationale",
-            "",
-            self.rationale or "[Why this requirement exists]",
-            "",
-            "## Acceptance Criteria",
-            "",
-        ]
-        if self.acceptance_criteria:
-            for criterion in self.acceptance_criteria:
-                lines.append(f"- [ ] {criterion}")
-        else:
-            lines.append("- [ ] [Criterion 1]")
-        return "\n".join(lines)
+        criteria = (
+            "\n".join(f"- [ ] {c}" for c in self.acceptance_criteria) or "- [ ] [Criterion 1]"
+        )
+        return (
+            f"# {self.title}\n"
+            "\n"
+            "## Description\n"
+            "\n"
+            f"{self.description or '[Requirement description]'}\n"
+            "\n"
+            "## Rationale\n"
+            "\n"
+            f"{self.rationale or '[Why this requirement exists]'}\n"
+            "\n"
+            "## Acceptance Criteria\n"
+            "\n"
+            f"{criteria}"
+        )
 
     @classmethod
     def from_frontmatter(cls, frontmatter: dict, content: str, is_functional: bool = True) -> "Requirement":
@@ -179,8 +224,12 @@ class Requirement:
             title=frontmatter["title"],
             description=_extract_section(content, "Description"),
             rationale=_extract_section(content, "Rationale"),
-            status=ArtifactStatus(frontmatter.get("status", "draft")),
-            priority=Priority(frontmatter.get("priority", "should")),
+            status=_enum_member(
+                _ARTIFACT_STATUS_BY_VALUE, ArtifactStatus, frontmatter.get("status", "draft")
+            ),
+            priority=_enum_member(
+                _PRIORITY_BY_VALUE, Priority, frontmatter.get("priority", "should")
+            ),
             feature=frontmatter.get("feature"),
             created=datetime.fromisoformat(frontmatter["created"]),
             updated=datetime.fromisoformat(frontmatter["updated"]),
@@ -190,42 +239,47 @@ class Requirement:
         )
 
 
-def _extract_section(content: str, section_name: str) -> str:
-    """Extract content under a ## heading."""
-    lines = content.split("\n")
-    in_section = False
-    section_lines = []
+@lru_cache(maxsize=128)
+def _parse_sections(content: str) -> dict[str, str]:
+    """Index a markdown body by its ## headings in a single pass.
+
+    Cached per content string, so extracting several sections from the same
+    document scans it once. The returned dict is shared and must not be modified.
+
+    Returns:
+        Stripped section text keyed by heading line (e.g. "## Contract").
+        The first section wins when a heading repeats.
+    """
+    sections: dict[str, str] = {}
+    matches = list(_SECTION_HEADING_RE.finditer(content))
+    for i, match in enumerate(matches):
+        # Each section runs until the next heading, or the end of the content
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(content)
+        sections.setdefault(match.group().strip(), content[match.end() : end].strip())
+    return sections
 
-    for line in lines:
-        if line.startswith("## "):
-            if in_section:
-                break
-            in_section = line.strip() == f"## {section_name}"
-        elif in_section:
-            section_lines.append(line)
 
-    return "\n".join(section_lines).strip()
+def _extract_section(content: str, section_name: str) -> str:
+    """Extract content under a ## heading."""
+    return _parse_sections(content).get(f"## {section_name}", "")
 
 
 def _extract_checklist(content: str, section_name: str) -> list[str]:
     """Extract checklist items from a section."""
-    section = _extract_section(content, section_name)
-    items = []
-    for line in section.split("\n"):
-        line = line.strip()
-        if line.startswith("- [ ] ") or line.startswith("- [x] "):
-            items.append(line[6:])
-    return items
+    return _CHECKLIST_ITEM_RE.findall(_extract_section(content, section_name))
 
 
 def _extract_code_block(content: str, section_name: str) -> str:
     """Extract code block content from a section."""
     section = _extract_section(content, section_name)
-    lines = section.split("\n")
+    if "```" not in section:
+        # Missing section or no fenced block in it
+        return ""
+
     in_code = False
     code_lines = []
 
-    for line in lines:
+    for line in section.splitlines():
         if line.startswith("```"):
             if in_code:
                 break
@@ -237,7 +291,7 @@ def _extract_code_block(content: str, section_name: str) -> str:
     return "\n".join(code_lines)
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """A task for autonomous execution."""
 
@@ -259,67 +313,66 @@ class Task:
     output_files: str = ""
     verification: str = ""
     done_when: list[str] = field(default_factory=list)
+    _iso_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
 
     def to_frontmatter(self) -> dict:
         """Convert to YAML frontmatter dict."""
+        created, updated = _iso_timestamps(self)
         return {
             "id": self.id,
             "title": self.title,
-            "status": self.status.value,
+            "status": self.status,
             "layer": self.layer,
-            "track": self.track.value,
+            "track": self.track,
             "depends_on": self.depends_on,
-            "estimated_complexity": self.estimated_complexity.value,
+            "estimated_complexity": self.estimated_complexity,
             "requirement": self.requirement,
-            "created": self.created.isoformat(),
-            "updated": self.updated.isoformat(),
+            "created": created,
+            "updated": updated,
         }
 
     def to_markdown(self) -> str:
         """Generate markdown body following contract-driven format."""
-        lines = [
-            f"# {self.id}: {self.title}",
-            "",
-            "## Contract",
-            "",
-            "```typescript",
-            self.contract or "// Define exports here",
-            "```",
-            "",
-            "## Dependencies (Interfaces Only)",
-            "",
-            "```typescript",
-            self.dependencies or "// Interface contracts from dependent tasks",
-            "```",
-            "",
-            "## Test Specification",
-            "",
-            "```typescript",
-            self.test_specification or "// Complete, runnable test code",
-            "```",
-            "",
-            "## Output Files",
-            "",
-            "```",
-            self.output_files or "WRITE: path/to/file.ts (~X lines)",
-            "```",
-            "",
-            "## Verification (Deterministic)",
-            "",
-            "```bash",
-            self.verification or "# Commands to verify success",
-            "```",
-            "",
-            "## Done When",
-            "",
-        ]
-        if self.done_when:
-            for criterion in self.done_when:
-                lines.append(f"- [ ] {criterion}")
-        else:
-            lines.append("- [ ] [Acceptance criterion]")
-
-        return "\n".join(lines)
+        done_when = (
+            "\n".join(f"- [ ] {c}" for c in self.done_when) or "- [ ] [Acceptance criterion]"
+        )
+        return (
+            f"# {self.id}: {self.title}\n"
+            "\n"
+            "## Contract\n"
+            "\n"
+            "```typescript\n"
+            f"{self.contract or '// Define exports here'}\n"
+            "```\n"
+            "\n"
+            "## Dependencies (Interfaces Only)\n"
+            "\n"
+            "```typescript\n"
+            f"{self.dependencies or '// Interface contracts from dependent tasks'}\n"
+            "```\n"
+            "\n"
+            "## Test Specification\n"
+            "\n"
+            "```typescript\n"
+            f"{self.test_specification or '// Complete, runnable test code'}\n"
+            "```\n"
+            "\n"
+            "## Output Files\n"
+            "\n"
+            "```\n"
+            f"{self.output_files or 'WRITE: path/to/file.ts (~X lines)'}\n"
+            "```\n"
+            "\n"
+            "## Verification (Deterministic)\n"
+            "\n"
+            "```bash\n"
+            f"{self.verification or '# Commands to verify success'}\n"
+            "```\n"
+            "\n"
+            "## Done When\n"
+            "\n"
+            f"{done_when}"
+        )
 
     @classmethod
     def from_frontmatter(cls, frontmatter: dict, content: str) -> "Task":
@@ -327,12 +380,18 @@ class Task:
         return cls(
             id=frontmatter["id"],
             title=frontmatter["title"],
-            status=TaskStatus(frontmatter.get("status", "pending")),
+            status=_enum_member(
+                _TASK_STATUS_BY_VALUE, TaskStatus, frontmatter.get("status", "pending")
+            ),
             layer=frontmatter.get("layer", 1),
-            track=TaskTrack(frontmatter.get("track", "backend")),
+            track=_enum_member(
+                _TASK_TRACK_BY_VALUE, TaskTrack, frontmatter.get("track", "backend")
+            ),
             depends_on=frontmatter.get("depends_on", []),
-            estimated_complexity=TaskComplexity(
-                frontmatter.get("estimated_complexity", "medium")
+            estimated_complexity=_enum_member(
+                _TASK_COMPLEXITY_BY_VALUE,
+                TaskComplexity,
+                frontmatter.get("estimated_complexity", "medium"),
             ),
             requirement=frontmatter.get("requirement"),
             created=datetime.fromisoformat(frontmatter["created"]),
@@ -18,7 +18,7 @@ class Specialization(str, Enum):
     CUSTOM = "custom"
 
 
-@dataclass
+@dataclass(slots=True)
 class Persona:
     """A persona representing a specific perspective or role."""
 
@@ -32,6 +32,7 @@ class Persona:
     focus_areas: list[str] = field(default_factory=list)
     questions_to_ask: list[str] = field(default_factory=list)  # Typical questions this persona asks
     custom_instructions: str = ""  # Additional system prompt additions
+    _cached_prompt: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self) -> dict:
         """Convert to dict for YAML serialization."""
@@ -64,8 +65,19 @@ class Persona:
             custom_instructions=data.get("custom_instructions", ""),
         )
 
+    def invalidate_prompt(self) -> None:
+        """Drop the cached system prompt after mutating persona fields."""
+        self._cached_prompt = None
+
     def to_system_prompt(self) -> str:
-        """Generate system prompt additions for this persona."""
+        """Generate system prompt additions for this persona.
+
+        The prompt is built once and cached on the instance; call
+        invalidate_prompt() after changing any field.
+        """
+        if self._cached_prompt is not None:
+            return self._cached_prompt
+
         lines = [f"You are acting as {self.name}, a {self.specialization.value.replace('_', ' ')}."]
 
         if self.description:
@@ -91,7 +103,8 @@ class Persona:
         if self.custom_instructions:
             lines.append(f"\n{self.custom_instructions}")
 
-        return "\n".join(lines)
+        self._cached_prompt = "\n".join(lines)
+        return self._cached_prompt
 
 
 # Default personas for common perspectives
@@ -216,3 +229,8 @@ DEFAULT_PERSONAS: dict[str, Persona] = {
         ],
     ),
 }
+
+# Build the built-in prompts at import so switching personas never formats them
+for _persona in DEFAULT_PERSONAS.values():
+    _persona.to_system_prompt()
+del _persona
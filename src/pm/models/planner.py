@@ -3,9 +3,12 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
+from pm.models._enums import _enum_member, _members_by_value
+
 
 class PlanningPhase(str, Enum):
     """Current phase in the planning process."""
@@ -32,10 +35,25 @@ class ProjectType(str, Enum):
     BROWNFIELD = "brownfield"
 
 
+_PHASE_BY_VALUE = _members_by_value(PlanningPhase)
+_CHECKPOINT_STATUS_BY_VALUE = _members_by_value(CheckpointStatus)
+_PROJECT_TYPE_BY_VALUE = _members_by_value(ProjectType)
+
+
+@lru_cache(maxsize=4096)
+def _parse_datetime(value: str) -> datetime:
+    """Parse an ISO timestamp, reusing results for repeated strings.
+
+    Checkpoints saved in the same session often share timestamps, and
+    datetimes are immutable, so the parsed objects can be shared.
+    """
+    return datetime.fromisoformat(value)
+
+
 # --- Tech Stack Models ---
 
 
-@dataclass
+@dataclass(slots=True)
 class Dependency:
     """A project dependency."""
 
@@ -55,7 +73,7 @@ class Dependency:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class FrameworkConfig:
     """Configuration for a framework."""
 
@@ -75,7 +93,7 @@ class FrameworkConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class RuntimeConfig:
     """Runtime configuration."""
 
@@ -102,7 +120,7 @@ class RuntimeConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class DatabaseConfig:
     """Database configuration."""
 
@@ -129,7 +147,7 @@ class DatabaseConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TestingConfig:
     """Testing framework configuration."""
 
@@ -149,7 +167,7 @@ class TestingConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TechStack:
     """Complete tech stack definition."""
 
@@ -180,7 +198,7 @@ class TechStack:
     def from_dict(cls, data: dict) -> "TechStack":
         return cls(
             version=data.get("version", "1.0"),
-            created=datetime.fromisoformat(data["created"]) if "created" in data else datetime.now(),
+            created=_parse_datetime(data["created"]) if "created" in data else datetime.now(),
             project_type=data.get("project_type", "web_application"),
             runtime=RuntimeConfig.from_dict(data["runtime"]) if data.get("runtime") else None,
             frameworks={k: FrameworkConfig.from_dict(v) for k, v in data.get("frameworks", {}).items()},
@@ -194,7 +212,7 @@ class TechStack:
 # --- Layer Models ---
 
 
-@dataclass
+@dataclass(slots=True)
 class Layer:
     """A layer in the architecture."""
 
@@ -230,7 +248,7 @@ class Layer:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class LayerDefinition:
     """Complete layers definition from architect phase."""
 
@@ -238,6 +256,10 @@ class LayerDefinition:
     created: datetime = field(default_factory=datetime.now)
     architect_summary: str = ""
     layers: list[Layer] = field(default_factory=list)
+    # Layer ID -> position of the first layer with that ID
+    _layer_index: Optional[dict[str, int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def to_dict(self) -> dict:
         return {
@@ -251,23 +273,33 @@ class LayerDefinition:
     def from_dict(cls, data: dict) -> "LayerDefinition":
         return cls(
             version=data.get("version", "1.0"),
-            created=datetime.fromisoformat(data["created"]) if "created" in data else datetime.now(),
+            created=_parse_datetime(data["created"]) if "created" in data else datetime.now(),
             architect_summary=data.get("architect_summary", ""),
             layers=[Layer.from_dict(layer) for layer in data.get("layers", [])],
         )
 
     def get_layer(self, layer_id: str) -> Optional[Layer]:
         """Get a layer by ID."""
-        for layer in self.layers:
-            if layer.id == layer_id:
-                return layer
-        return None
+        layers = self.layers
+        index = self._layer_index
+        if index is not None:
+            pos = index.get(layer_id)
+            if pos is not None and pos < len(layers) and layers[pos].id == layer_id:
+                return layers[pos]
+
+        # Built on first lookup and rebuilt on a miss or when the indexed position
+        # no longer holds that ID (list reassigned, reordered or edited in place)
+        index = self._layer_index = {
+            layer.id: pos for pos, layer in reversed(list(enumerate(layers)))
+        }
+        pos = index.get(layer_id)
+        return layers[pos] if pos is not None else None
 
 
 # --- Group Models ---
 
 
-@dataclass
+@dataclass(slots=True)
 class ContractExport:
     """An exported contract from a group."""
 
@@ -283,7 +315,7 @@ class ContractExport:
         return cls(name=data["name"], type=data["type"], file=data["file"])
 
 
-@dataclass
+@dataclass(slots=True)
 class InterfaceMethod:
     """A method signature in an interface."""
 
@@ -297,7 +329,7 @@ class InterfaceMethod:
         return cls(signature=data)
 
 
-@dataclass
+@dataclass(slots=True)
 class ContractInterface:
     """An interface definition in a contract."""
 
@@ -312,7 +344,7 @@ class ContractInterface:
         return cls(name=data["name"], methods=data.get("methods", []))
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupContract:
     """Contract definitions for a group."""
 
@@ -333,7 +365,7 @@ class GroupContract:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Group:
     """A group within a layer."""
 
@@ -369,7 +401,7 @@ class Group:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupDefinition:
     """Groups definition for a layer."""
 
@@ -378,6 +410,10 @@ class GroupDefinition:
     layer_name: str = ""
     groups: list[Group] = field(default_factory=list)
     execution_order: list[list[str]] = field(default_factory=list)
+    # Group ID -> position of the first group with that ID
+    _group_index: Optional[dict[str, int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def to_dict(self) -> dict:
         return {
@@ -400,16 +436,26 @@ class GroupDefinition:
 
     def get_group(self, group_id: str) -> Optional[Group]:
         """Get a group by ID."""
-        for group in self.groups:
-            if group.id == group_id:
-                return group
-        return None
+        groups = self.groups
+        index = self._group_index
+        if index is not None:
+            pos = index.get(group_id)
+            if pos is not None and pos < len(groups) and groups[pos].id == group_id:
+                return groups[pos]
+
+        # Built on first lookup and rebuilt on a miss or when the indexed position
+        # no longer holds that ID (list reassigned, reordered or edited in place)
+        index = self._group_index = {
+            group.id: pos for pos, group in reversed(list(enumerate(groups)))
+        }
+        pos = index.get(group_id)
+        return groups[pos] if pos is not None else None
 
 
 # --- Checkpoint Models ---
 
 
-@dataclass
+@dataclass(slots=True)
 class Checkpoint:
     """A checkpoint requiring user approval."""
 
@@ -421,37 +467,62 @@ class Checkpoint:
     approved_at: Optional[datetime] = None
     feedback: str = ""
     artifacts: list[str] = field(default_factory=list)
+    # Response cache key of the phase output this checkpoint was created from
+    response_key: str = ""
+    # (status, approved_at, feedback, dict) from the last to_dict() call
+    _dict_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self) -> dict:
-        return {
+        """Serialize the checkpoint.
+
+        Only status, approved_at and feedback change after a checkpoint is
+        created, so the dict is reused until one of them is reassigned and
+        callers get a shallow copy of it.
+        """
+        cache = self._dict_cache
+        if (
+            cache is not None
+            and cache[0] is self.status
+            and cache[1] is self.approved_at
+            and cache[2] is self.feedback
+        ):
+            return dict(cache[3])
+
+        data = {
             "id": self.id,
-            "phase": self.phase.value,
+            "phase": self.phase,
             "description": self.description,
-            "status": self.status.value,
+            "status": self.status,
             "created": self.created.isoformat(),
             "approved_at": self.approved_at.isoformat() if self.approved_at else None,
             "feedback": self.feedback,
             "artifacts": self.artifacts,
+            "response_key": self.response_key,
         }
+        self._dict_cache = (self.status, self.approved_at, self.feedback, data)
+        return dict(data)
 
     @classmethod
     def from_dict(cls, data: dict) -> "Checkpoint":
         return cls(
             id=data["id"],
-            phase=PlanningPhase(data["phase"]),
+            phase=_enum_member(_PHASE_BY_VALUE, PlanningPhase, data["phase"]),
             description=data["description"],
-            status=CheckpointStatus(data.get("status", "pending")),
-            created=datetime.fromisoformat(data["created"]),
-            approved_at=datetime.fromisoformat(data["approved_at"]) if data.get("approved_at") else None,
+            status=_enum_member(
+                _CHECKPOINT_STATUS_BY_VALUE, CheckpointStatus, data.get("status", "pending")
+            ),
+            created=_parse_datetime(data["created"]),
+            approved_at=_parse_datetime(data["approved_at"]) if data.get("approved_at") else None,
             feedback=data.get("feedback", ""),
             artifacts=data.get("artifacts", []),
+            response_key=data.get("response_key", ""),
         )
 
 
 # --- Session Models ---
 
 
-@dataclass
+@dataclass(slots=True)
 class PlanningSession:
     """A planning session state."""
 
@@ -465,24 +536,29 @@ class PlanningSession:
     # Phase progress
     current_layer_id: Optional[str] = None
     current_group_id: Optional[str] = None
-    completed_layers: list[str] = field(default_factory=list)
-    completed_groups: list[str] = field(default_factory=list)
+    completed_layers: set[str] = field(default_factory=set)
+    completed_groups: set[str] = field(default_factory=set)
+    layer_groups: dict[str, list[str]] = field(default_factory=dict)  # layer ID -> planned group IDs
 
     # Checkpoints
     checkpoints: list[Checkpoint] = field(default_factory=list)
+    # Checkpoints before this index are approved or rejected. Resolved
+    # checkpoints never return to pending, so scans can start here.
+    _pending_scan_start: int = field(default=0, init=False, repr=False, compare=False)
 
     def to_dict(self) -> dict:
         return {
             "id": self.id,
-            "project_type": self.project_type.value,
-            "current_phase": self.current_phase.value,
+            "project_type": self.project_type,
+            "current_phase": self.current_phase,
             "target_repo": str(self.target_repo) if self.target_repo else None,
             "created": self.created.isoformat(),
             "updated": self.updated.isoformat(),
             "current_layer_id": self.current_layer_id,
             "current_group_id": self.current_group_id,
-            "completed_layers": self.completed_layers,
-            "completed_groups": self.completed_groups,
+            "completed_layers": sorted(self.completed_layers),
+            "completed_groups": sorted(self.completed_groups),
+            "layer_groups": self.layer_groups,
             "checkpoints": [c.to_dict() for c in self.checkpoints],
         }
 
@@ -490,45 +566,60 @@ class PlanningSession:
     def from_dict(cls, data: dict) -> "PlanningSession":
         return cls(
             id=data["id"],
-            project_type=ProjectType(data.get("project_type", "greenfield")),
-            current_phase=PlanningPhase(data.get("current_phase", "not_started")),
+            project_type=_enum_member(
+                _PROJECT_TYPE_BY_VALUE, ProjectType, data.get("project_type", "greenfield")
+            ),
+            current_phase=_enum_member(
+                _PHASE_BY_VALUE, PlanningPhase, data.get("current_phase", "not_started")
+            ),
             target_repo=Path(data["target_repo"]) if data.get("target_repo") else None,
-            created=datetime.fromisoformat(data["created"]),
-            updated=datetime.fromisoformat(data["updated"]),
+            created=_parse_datetime(data["created"]),
+            updated=_parse_datetime(data["updated"]),
             current_layer_id=data.get("current_layer_id"),
             current_group_id=data.get("current_group_id"),
-            completed_layers=data.get("completed_layers", []),
-            completed_groups=data.get("completed_groups", []),
+            completed_layers=set(data.get("completed_layers", [])),
+            completed_groups=set(data.get("completed_groups", [])),
+            layer_groups=data.get("layer_groups", {}),
             checkpoints=[Checkpoint.from_dict(c) for c in data.get("checkpoints", [])],
         )
 
     def get_pending_checkpoint(self) -> Optional[Checkpoint]:
         """Get the current pending checkpoint, if any."""
-        for checkpoint in self.checkpoints:
-            if checkpoint.status == CheckpointStatus.PENDING:
-                return checkpoint
+        checkpoints = self.checkpoints
+        for index in range(self._pending_scan_start, len(checkpoints)):
+            if checkpoints[index].status == CheckpointStatus.PENDING:
+                self._pending_scan_start = index
+                return checkpoints[index]
+        self._pending_scan_start = len(checkpoints)
         return None
 
     def add_checkpoint(
-        self, phase: PlanningPhase, description: str, artifacts: list[str] | None = None
+        self,
+        phase: PlanningPhase,
+        description: str,
+        artifacts: list[str] | None = None,
+        response_key: str = "",
     ) -> Checkpoint:
         """Add a new checkpoint."""
+        now = datetime.now()
         checkpoint_id = f"cp-{len(self.checkpoints) + 1:03d}"
         checkpoint = Checkpoint(
             id=checkpoint_id,
             phase=phase,
             description=description,
+            created=now,
             artifacts=artifacts or [],
+            response_key=response_key,
         )
         self.checkpoints.append(checkpoint)
-        self.updated = datetime.now()
+        self.updated = now
         return checkpoint
 
 
 # --- Codebase Analysis Models (for brownfield) ---
 
 
-@dataclass
+@dataclass(slots=True)
 class ExistingPattern:
     """A pattern found in the existing codebase."""
 
@@ -555,7 +646,7 @@ class ExistingPattern:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CodebaseAnalysis:
     """Analysis results for an existing codebase."""
 
@@ -583,7 +674,7 @@ class CodebaseAnalysis:
     @classmethod
     def from_dict(cls, data: dict) -> "CodebaseAnalysis":
         return cls(
-            analyzed_at=datetime.fromisoformat(data["analyzed_at"]) if "analyzed_at" in data else datetime.now(),
+            analyzed_at=_parse_datetime(data["analyzed_at"]) if "analyzed_at" in data else datetime.now(),
             detected_language=data.get("detected_language", ""),
             detected_framework=data.get("detected_framework", ""),
             package_manager=data.get("package_manager", ""),
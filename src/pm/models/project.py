@@ -6,6 +6,8 @@ from enum import Enum
 from pathlib import Path
 from typing import Optional
 
+from pm.models._enums import _enum_member, _members_by_value
+
 
 class ProjectStatus(str, Enum):
     """Project lifecycle status."""
@@ -20,7 +22,10 @@ class ProjectStatus(str, Enum):
     ARCHIVED = "archived"
 
 
-@dataclass
+_STATUS_BY_VALUE = _members_by_value(ProjectStatus)
+
+
+@dataclass(slots=True)
 class Project:
     """A product management project."""
 
@@ -37,7 +42,7 @@ class Project:
         return {
             "id": self.id,
             "name": self.name,
-            "status": self.status.value,
+            "status": self.status,
             "created": self.created.isoformat(),
             "updated": self.updated.isoformat(),
             "git_branch": self.git_branch,
@@ -50,7 +55,7 @@ class Project:
         return cls(
             id=data["id"],
             name=data["name"],
-            status=ProjectStatus(data.get("status", "ideation")),
+            status=_enum_member(_STATUS_BY_VALUE, ProjectStatus, data.get("status", "ideation")),
             created=datetime.fromisoformat(data["created"]),
             updated=datetime.fromisoformat(data["updated"]),
             git_branch=data.get("git_branch", "main"),
@@ -1,43 +1,148 @@
 """File management utilities for markdown + YAML frontmatter."""
 
+import json
+import os
+import re
+from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, TypeVar
+from uuid import uuid4
 
 import frontmatter
 import yaml
 
+try:
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _SafeDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 T = TypeVar("T")
 
 
+class _YamlDumper(_SafeDumper):  # type: ignore[misc,valid-type]
+    """Safe dumper that writes enum members as their values."""
+
+
+_YamlDumper.add_multi_representer(
+    Enum, lambda dumper, member: dumper.represent_data(member.value)
+)
+
+
+class _FrontmatterHandler(frontmatter.YAMLHandler):
+    """YAML frontmatter handler using this module's loader and dumper.
+
+    These are the libyaml classes when available, and the dumper writes enum
+    members as their values.
+    """
+
+    def load(self, fm: str, **kwargs: object) -> Any:
+        kwargs.setdefault("Loader", _YamlLoader)
+        return super().load(fm, **kwargs)
+
+    def export(self, metadata: dict[str, object], **kwargs: object) -> str:
+        kwargs.setdefault("Dumper", _YamlDumper)
+        return super().export(metadata, **kwargs)
+
+
+_FRONTMATTER_HANDLER = _FrontmatterHandler()
+
+_DUMP_OPTIONS: dict[str, Any] = {
+    "Dumper": _YamlDumper,
+    "default_flow_style": False,
+    "allow_unicode": True,
+    "sort_keys": False,
+}
+
+_SLUG_STRIP_RE = re.compile(r"[^\w\s-]")
+_SLUG_SEPARATOR_RE = re.compile(r"[-\s]+")
+
+
 def read_frontmatter_file(path: Path) -> tuple[dict[str, Any], str]:
     """Read a markdown file with YAML frontmatter.
 
     Returns:
-        Tuple of (frontmatter dict, markdown content)
+        Tuple of (frontmatter dict, markdown content). The dict is the one
+        parsed for this call, not a copy, and is owned by the caller.
     """
-    post = frontmatter.load(path)
-    return dict(post.metadata), post.content
+    post = frontmatter.load(path, handler=_FRONTMATTER_HANDLER)
+    return post.metadata, post.content
 
 
 def write_frontmatter_file(path: Path, metadata: dict[str, Any], content: str) -> None:
     """Write a markdown file with YAML frontmatter."""
-    path.parent.mkdir(parents=True, exist_ok=True)
     post = frontmatter.Post(content, **metadata)
-    with open(path, "w") as f:
-        f.write(frontmatter.dumps(post))
+    _write_atomic(path, frontmatter.dumps(post, handler=_FRONTMATTER_HANDLER).encode("utf-8"))
 
 
 def read_yaml_file(path: Path) -> dict[str, Any]:
     """Read a YAML file."""
-    with open(path) as f:
-        return yaml.safe_load(f) or {}
+    # libyaml decodes the bytes itself, so skip the text-mode wrapper
+    return yaml.load(path.read_bytes(), Loader=_YamlLoader) or {}
+
+
+def load_yaml(text: str) -> Any:
+    """Parse a YAML string with the same safe loader as read_yaml_file."""
+    return yaml.load(text, Loader=_YamlLoader)
 
 
 def write_yaml_file(path: Path, data: dict[str, Any]) -> None:
     """Write a YAML file."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w") as f:
-        yaml.dump(data, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+    # Serialize straight to UTF-8 bytes so the file gets one write instead of one per token
+    _write_atomic(path, yaml.dump(data, encoding="utf-8", **_DUMP_OPTIONS))
+
+
+def _write_atomic(path: Path, content: bytes, sync: bool = False) -> None:
+    """Write bytes to a file in one write and swap it into place.
+
+    The data goes to a temporary file next to the target, which then
+    replaces it, so readers never see a partial file. The parent directory
+    is created only if the write finds it missing, so saves into an
+    existing directory skip the mkdir calls.
+    """
+    tmp_path = path.with_name(f".{path.name}.{uuid4().hex}.tmp")
+    try:
+        try:
+            fh = tmp_path.open("wb")
+        except FileNotFoundError:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fh = tmp_path.open("wb")
+        with fh:
+            fh.write(content)
+            if sync:
+                fh.flush()
+                os.fsync(fh.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def read_json_file(path: Path) -> dict[str, Any]:
+    """Read a JSON state file."""
+    return json.loads(path.read_bytes() or b"{}")
+
+
+def write_json_file(path: Path, content: bytes, sync: bool = False) -> None:
+    """Write a JSON state file serialized with dump_json.
+
+    Args:
+        path: File to write.
+        content: Serialized JSON.
+        sync: Also fsync the file so the write survives a crash.
+    """
+    _write_atomic(path, content, sync)
+
+
+def dump_json(data: dict[str, Any]) -> bytes:
+    """Serialize machine-read state to compact UTF-8 JSON.
+
+    Output is unindented because json only uses its C encoder without
+    indent; indented dumps run the pure-Python encoder.
+    """
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
 
 
 def ensure_directory(path: Path) -> Path:
@@ -46,14 +151,12 @@ def ensure_directory(path: Path) -> Path:
     return path
 
 
+@lru_cache(maxsize=128)
 def slugify(text: str) -> str:
     """Convert text to a URL-safe slug."""
-    import re
-
     text = text.lower().strip()
-    text = re.sub(r"[^\w\s-]", "", text)
-    text = re.sub(r"[-\s]+", "-", text)
-    return text
+    text = _SLUG_STRIP_RE.sub("", text)
+    return _SLUG_SEPARATOR_RE.sub("-", text)
 
 
 def generate_id(prefix: str, existing_ids: list[str]) -> str:
@@ -61,12 +164,16 @@ def generate_id(prefix: str, existing_ids: list[str]) -> str:
 
     Example: generate_id("F", ["F-001", "F-002"]) -> "F-003"
     """
+    marker = f"{prefix}-"
+    start = len(marker)
     max_num = 0
     for id_ in existing_ids:
-        if id_.startswith(f"{prefix}-"):
+        if id_.startswith(marker):
             try:
-                num = int(id_.split("-")[1])
-                max_num = max(max_num, num)
-            except (IndexError, ValueError):
-                pass
+                # Number is the part between the prefix dash and the next dash, if any
+                num = int(id_[start:].partition("-")[0])
+            except ValueError:
+                continue
+            if num > max_num:
+                max_num = num
     return f"{prefix}-{max_num + 1:03d}"
@@ -0,0 +1,54 @@
+"""Tests for the planner data models."""
+
+from pm.models.planner import Group, GroupDefinition, Layer, LayerDefinition
+
+
+def test_get_layer_sees_in_place_replacement() -> None:
+    defs = LayerDefinition(
+        layers=[Layer(id="L1", name="old", order=1), Layer(id="L2", name="b", order=2)]
+    )
+    original = defs.get_layer("L1")
+    assert original is not None and original.name == "old"
+
+    replacement = Layer(id="L1", name="replaced", order=1)
+    defs.layers[0] = replacement
+
+    assert defs.get_layer("L1") is replacement
+
+
+def test_get_layer_follows_changed_ids() -> None:
+    defs = LayerDefinition(layers=[Layer(id="L1", name="a", order=1)])
+    assert defs.get_layer("L1") is not None
+
+    defs.layers[0].id = "L9"
+
+    assert defs.get_layer("L1") is None
+    assert defs.get_layer("L9") is defs.layers[0]
+
+
+def test_get_layer_returns_first_duplicate() -> None:
+    first = Layer(id="L1", name="first", order=1)
+    defs = LayerDefinition(layers=[first, Layer(id="L1", name="second", order=2)])
+
+    assert defs.get_layer("L1") is first
+
+
+def test_get_group_sees_in_place_replacement() -> None:
+    defs = GroupDefinition(groups=[Group(id="G1", name="old", order=1)])
+    original = defs.get_group("G1")
+    assert original is not None and original.name == "old"
+
+    replacement = Group(id="G1", name="replaced", order=1)
+    defs.groups[0] = replacement
+
+    assert defs.get_group("G1") is replacement
+
+
+def test_get_group_sees_reassigned_list() -> None:
+    defs = GroupDefinition(groups=[Group(id="G1", name="a", order=1)])
+    assert defs.get_group("G1") is not None
+
+    defs.groups = [Group(id="G2", name="b", order=1)]
+
+    assert defs.get_group("G1") is None
+    assert defs.get_group("G2") is defs.groups[0]
@@ -0,0 +1,32 @@
+"""Tests for the project manager."""
+
+from datetime import datetime
+from pathlib import Path
+
+from pm.core.project import ProjectManager
+from pm.models.project import ProjectStatus
+
+
+def test_set_status_unchanged_skips_write(tmp_path: Path) -> None:
+    manager = ProjectManager(tmp_path)
+    project = manager.create_project("Demo")
+    meta_file = manager.get_project_path(project.id) / ".project.yaml"
+    before = meta_file.read_bytes()
+    updated = project.updated
+
+    manager.set_status(project.status)
+
+    assert project.updated == updated
+    assert meta_file.read_bytes() == before
+
+
+def test_set_status_changed_writes_and_bumps_updated(tmp_path: Path) -> None:
+    manager = ProjectManager(tmp_path)
+    project = manager.create_project("Demo")
+    project.updated = datetime(2000, 1, 1)
+
+    manager.set_status(ProjectStatus.DESIGN)
+
+    assert project.updated > datetime(2000, 1, 1)
+    reloaded = manager.get_project(project.id)
+    assert reloaded is not None and reloaded.status is ProjectStatus.DESIGN